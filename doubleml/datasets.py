@@ -1,22 +1,67 @@
 import pandas as pd
 import numpy as np
 import warnings
+import os
+import shutil
+import hashlib
 
+from urllib.request import urlopen
+
+from joblib import Parallel, delayed
 from scipy.linalg import toeplitz
 from scipy.optimize import minimize_scalar
+from scipy.special import expit
 
 from sklearn.preprocessing import PolynomialFeatures, OneHotEncoder
-from sklearn.datasets import make_spd_matrix
 
 from .double_ml_data import DoubleMLData, DoubleMLClusterData
 
-_array_alias = ['array', 'np.ndarray', 'np.array', np.ndarray]
-_data_frame_alias = ['DataFrame', 'pd.DataFrame', pd.DataFrame]
-_dml_data_alias = ['DoubleMLData', DoubleMLData]
-_dml_cluster_data_alias = ['DoubleMLClusterData', DoubleMLClusterData]
-
-
-def fetch_401K(return_type='DoubleMLData', polynomial_features=False):
+_array_alias = ('array', 'np.ndarray', 'np.array', np.ndarray)
+_data_frame_alias = ('DataFrame', 'pd.DataFrame', pd.DataFrame)
+_dml_data_alias = ('DoubleMLData', DoubleMLData)
+_dml_cluster_data_alias = ('DoubleMLClusterData', DoubleMLClusterData)
+_data_frame_or_dml_data_alias = _data_frame_alias + _dml_data_alias
+_data_frame_or_dml_cluster_data_alias = _data_frame_alias + _dml_cluster_data_alias
+
+
+def _get_data_home(data_home=None):
+    # defaults to the environment variable DOUBLEML_DATA or ~/.cache/doubleml
+    if data_home is None:
+        data_home = os.environ.get('DOUBLEML_DATA', os.path.join('~', '.cache', 'doubleml'))
+    data_home = os.path.expanduser(data_home)
+    os.makedirs(data_home, exist_ok=True)
+    return data_home
+
+
+def _download_cached(url, data_home=None):
+    # the raw file is downloaded once and stored as is, such that no pickled objects are loaded from the cache
+    url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    file_path = os.path.join(_get_data_home(data_home), f'{url_hash}_{os.path.basename(url)}')
+    if not os.path.exists(file_path):
+        # write to a temporary file first to not leave a partial download behind
+        tmp_path = f'{file_path}.{os.getpid()}.tmp'
+        try:
+            with urlopen(url) as response, open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return file_path
+
+
+def _read_cached(url, read_fun, data_home=None):
+    file_path = _download_cached(url, data_home)
+    try:
+        raw_data = read_fun(file_path)
+    except Exception:
+        # an unreadable cache file (e.g. truncated) is replaced by a fresh download
+        os.remove(file_path)
+        raw_data = read_fun(_download_cached(url, data_home))
+    return raw_data
+
+
+def fetch_401K(return_type='DoubleMLData', polynomial_features=False, data_home=None):
     """
     Data set on financial wealth and 401(k) plan participation.
 
@@ -28,6 +73,9 @@ def fetch_401K(return_type='DoubleMLData', polynomial_features=False):
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
     polynomial_features :
         If ``True`` polynomial features are added (see replication files of Chernozhukov et al. (2018)).
+    data_home :
+        Folder in which the downloaded data is cached. If ``None``, the environment variable ``DOUBLEML_DATA`` or
+        ``~/.cache/doubleml`` is used.
 
     References
     ----------
@@ -39,7 +87,7 @@ def fetch_401K(return_type='DoubleMLData', polynomial_features=False):
     doi:`10.1111/ectj.12097 <https://doi.org/10.1111/ectj.12097>`_.
     """
     url = 'https://github.com/VC2015/DMLonGitHub/raw/master/sipp1991.dta'
-    raw_data = pd.read_stata(url)
+    raw_data = _read_cached(url, pd.read_stata, data_home)
 
     y_col = 'net_tfa'
     d_cols = ['e401']
@@ -50,7 +98,7 @@ def fetch_401K(return_type='DoubleMLData', polynomial_features=False):
     if polynomial_features:
         raise NotImplementedError('polynomial_features os not implemented yet for fetch_401K.')
 
-    if return_type in _data_frame_alias + _dml_data_alias:
+    if return_type in _data_frame_or_dml_data_alias:
         if return_type in _data_frame_alias:
             return data
         else:
@@ -59,7 +107,7 @@ def fetch_401K(return_type='DoubleMLData', polynomial_features=False):
         raise ValueError('Invalid return_type.')
 
 
-def fetch_bonus(return_type='DoubleMLData', polynomial_features=False):
+def fetch_bonus(return_type='DoubleMLData', polynomial_features=False, data_home=None):
     """
     Data set on the Pennsylvania Reemployment Bonus experiment.
 
@@ -71,6 +119,9 @@ def fetch_bonus(return_type='DoubleMLData', polynomial_features=False):
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
     polynomial_features :
         If ``True`` polynomial features are added (see replication files of Chernozhukov et al. (2018)).
+    data_home :
+        Folder in which the downloaded data is cached. If ``None``, the environment variable ``DOUBLEML_DATA`` or
+        ``~/.cache/doubleml`` is used.
 
     References
     ----------
@@ -82,7 +133,7 @@ def fetch_bonus(return_type='DoubleMLData', polynomial_features=False):
     doi:`10.1111/ectj.12097 <https://doi.org/10.1111/ectj.12097>`_.
     """
     url = 'https://raw.githubusercontent.com/VC2015/DMLonGitHub/master/penn_jae.dat'
-    raw_data = pd.read_csv(url, sep='\s+')
+    raw_data = _read_cached(url, lambda x: pd.read_csv(x, sep='\s+'), data_home)
 
     ind = (raw_data['tg'] == 0) | (raw_data['tg'] == 4)
     data = raw_data.copy()[ind]
@@ -112,7 +163,7 @@ def fetch_bonus(return_type='DoubleMLData', polynomial_features=False):
         data = pd.concat((data[[y_col] + d_cols], data_transf),
                          axis=1, sort=False)
 
-    if return_type in _data_frame_alias + _dml_data_alias:
+    if return_type in _data_frame_or_dml_data_alias:
         if return_type in _data_frame_alias:
             return data
         else:
@@ -129,7 +180,45 @@ def _m(x, nu=0., gamma=1.):
     return 0.5/np.pi*(np.sinh(gamma))/(np.cosh(gamma)-np.cos(x-nu))
 
 
-def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLData', **kwargs):
+def _cov_factor(cov_mat):
+    # factor L with L @ L.T = cov_mat; Cholesky is cheaper than the SVD used by np.random.multivariate_normal
+    try:
+        factor = np.linalg.cholesky(cov_mat)
+    except np.linalg.LinAlgError:
+        # positive semi-definite (singular) covariance matrices
+        eig_vals, eig_vecs = np.linalg.eigh(cov_mat)
+        factor = eig_vecs * np.sqrt(np.clip(eig_vals, 0., None))
+    return factor
+
+
+def _mvn(rng, cov_mat, n_obs, dtype=np.float64):
+    factor = _cov_factor(cov_mat).astype(dtype, copy=False)
+    return rng.standard_normal(size=[n_obs, factor.shape[0]], dtype=dtype) @ factor.T
+
+
+def _bivariate_normal(rng, rho, n_obs, dtype=np.float64):
+    # standard bivariate normal with correlation rho, drawn via the closed-form Cholesky factor of [[1, rho], [rho, 1]]
+    xx = rng.standard_normal(size=[n_obs, 2], dtype=dtype)
+    rho = float(rho)
+    xx[:, 1] = rho * xx[:, 0] + (1. - rho**2)**0.5 * xx[:, 1]
+    return xx
+
+
+def _get_rng(random_state):
+    # without a random_state the seed is drawn from the global numpy random state, such that np.random.seed() still
+    # makes the data generating processes reproducible
+    if random_state is None:
+        random_state = np.random.randint(np.iinfo(np.int32).max)
+    return np.random.default_rng(random_state)
+
+
+def _spd(dim_x, rng):
+    # random symmetric positive-definite matrix; A @ A.T is positive semi-definite and the identity shifts the eigenvalues
+    a = rng.standard_normal(size=[dim_x, dim_x])
+    return a @ a.T / dim_x + np.eye(dim_x)
+
+
+def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLData', random_state=None, **kwargs):
     """
     Generates data from a partially linear regression model used in Chernozhukov et al. (2018) for Figure 1.
     The data generating process is defined as
@@ -165,6 +254,9 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
     **kwargs
         Additional keyword arguments to set non-default values for the parameters
         :math:`a_0=1`, :math:`a_1=0.25`, :math:`s_1=1`, :math:`b_0=1`, :math:`b_1=0.25` or :math:`s_2=1`.
@@ -175,6 +267,7 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
     Double/debiased machine learning for treatment and structural parameters. The Econometrics Journal, 21: C1-C68.
     doi:`10.1111/ectj.12097 <https://doi.org/10.1111/ectj.12097>`_.
     """
+    rng = _get_rng(random_state)
     a_0 = kwargs.get('a_0', 1.)
     a_1 = kwargs.get('a_1', 0.25)
     s_1 = kwargs.get('s_1', 1.)
@@ -183,17 +276,17 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
     b_1 = kwargs.get('b_1', 0.25)
     s_2 = kwargs.get('s_2', 1.)
 
-    cov_mat = toeplitz([np.power(0.7, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(0.7, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
-    d = a_0 * x[:, 0] + a_1 * np.divide(np.exp(x[:, 2]), 1 + np.exp(x[:, 2])) \
-        + s_1 * np.random.standard_normal(size=[n_obs, ])
-    y = alpha * d + b_0 * np.divide(np.exp(x[:, 0]), 1 + np.exp(x[:, 0])) \
-        + b_1 * x[:, 2] + s_2 * np.random.standard_normal(size=[n_obs, ])
+    d = a_0 * x[:, 0] + a_1 * expit(x[:, 2]) \
+        + s_1 * rng.standard_normal(size=[n_obs, ])
+    y = alpha * d + b_0 * expit(x[:, 0]) \
+        + b_1 * x[:, 2] + s_2 * rng.standard_normal(size=[n_obs, ])
 
     if return_type in _array_alias:
         return x, y, d
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         data = pd.DataFrame(np.column_stack((x, y, d)),
                             columns=x_cols + ['y', 'd'])
@@ -205,7 +298,7 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
         raise ValueError('Invalid return_type.')
 
 
-def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLData', **kwargs):
+def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLData', random_state=None, **kwargs):
     """
     Generates data from a partially linear regression model used in a blog article by Turrell (2018).
     The data generating process is defined as
@@ -217,8 +310,9 @@ def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLDa
         y_i &= \\theta d_i + g_0(x_i' b) + u_i, & &u_i \\sim \\mathcal{N}(0,1),
 
 
-    with covariates :math:`x_i \\sim \\mathcal{N}(0, \\Sigma)`, where  :math:`\\Sigma` is a random symmetric,
-    positive-definite matrix generated with :py:meth:`sklearn.datasets.make_spd_matrix`.
+    with covariates :math:`x_i \\sim \\mathcal{N}(0, \\Sigma)`, where  :math:`\\Sigma = \\frac{1}{p} A A^T + I_p` is a
+    random symmetric, positive-definite matrix with :math:`A_{jk} \\sim \\mathcal{N}(0,1)` and :math:`p` the number of
+    covariates.
     :math:`b` is a vector with entries :math:`b_j=\\frac{1}{j}` and the nuisance functions are given by
 
     .. math::
@@ -241,6 +335,9 @@ def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLDa
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
     **kwargs
         Additional keyword arguments to set non-default values for the parameters
         :math:`\\nu=0`, or :math:`\\gamma=1`.
@@ -251,21 +348,23 @@ def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLDa
     science, coding and data. `https://aeturrell.com/blog/posts/econometrics-in-python-parti-ml/
     <https://aeturrell.com/blog/posts/econometrics-in-python-parti-ml/>`_.
     """
+    rng = _get_rng(random_state)
     nu = kwargs.get('nu', 0.)
     gamma = kwargs.get('gamma', 1.)
 
-    b = [1 / k for k in range(1, dim_x + 1)]
-    sigma = make_spd_matrix(dim_x)
+    b = 1. / np.arange(1, dim_x + 1)
+    sigma = _spd(dim_x, rng)
 
-    x = np.random.multivariate_normal(np.zeros(dim_x), sigma, size=[n_obs, ])
-    G = _g(np.dot(x, b))
-    M = _m(np.dot(x, b), nu=nu, gamma=gamma)
-    d = M + np.random.standard_normal(size=[n_obs, ])
-    y = np.dot(theta, d) + G + np.random.standard_normal(size=[n_obs, ])
+    x = _mvn(rng, sigma, n_obs)
+    x_b = np.dot(x, b)
+    G = _g(x_b)
+    M = _m(x_b, nu=nu, gamma=gamma)
+    d = M + rng.standard_normal(size=[n_obs, ])
+    y = theta * d + G + rng.standard_normal(size=[n_obs, ])
 
     if return_type in _array_alias:
         return x, y, d
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         data = pd.DataFrame(np.column_stack((x, y, d)),
                             columns=x_cols + ['y', 'd'])
@@ -277,7 +376,7 @@ def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLDa
         raise ValueError('Invalid return_type.')
 
 
-def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type='DoubleMLData'):
+def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type='DoubleMLData', random_state=None):
     """
     Generates data from a interactive regression (IRM) model.
     The data generating process is defined as
@@ -320,32 +419,36 @@ def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type=
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
 
     References
     ----------
     Belloni, A., Chernozhukov, V., Fernández‐Val, I. and Hansen, C. (2017). Program Evaluation and Causal Inference With
     High‐Dimensional Data. Econometrica, 85: 233-298.
     """
+    rng = _get_rng(random_state)
     # inspired by https://onlinelibrary.wiley.com/doi/abs/10.3982/ECTA12723, see suplement
-    v = np.random.uniform(size=[n_obs, ])
-    zeta = np.random.standard_normal(size=[n_obs, ])
+    v = rng.uniform(size=[n_obs, ])
+    zeta = rng.standard_normal(size=[n_obs, ])
 
-    cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(0.5, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
-    beta = [1 / (k**2) for k in range(1, dim_x + 1)]
+    beta = 1. / np.arange(1, dim_x + 1)**2
     b_sigma_b = np.dot(np.dot(cov_mat, beta), beta)
     c_y = np.sqrt(R2_y/((1-R2_y) * b_sigma_b))
     c_d = np.sqrt(np.pi**2 / 3. * R2_d/((1-R2_d) * b_sigma_b))
 
-    xx = np.exp(np.dot(x, np.multiply(beta, c_d)))
-    d = 1. * ((xx/(1+xx)) > v)
+    x_beta = np.dot(x, beta)
+    d = 1. * (expit(c_d * x_beta) > v)
 
-    y = d * theta + d * np.dot(x, np.multiply(beta, c_y)) + zeta
+    y = d * theta + d * c_y * x_beta + zeta
 
     if return_type in _array_alias:
         return x, y, d
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         data = pd.DataFrame(np.column_stack((x, y, d)),
                             columns=x_cols + ['y', 'd'])
@@ -357,7 +460,7 @@ def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type=
         raise ValueError('Invalid return_type.')
 
 
-def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='DoubleMLData'):
+def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='DoubleMLData', random_state=None):
     """
     Generates data from a interactive IV regression (IIVM) model.
     The data generating process is defined as
@@ -398,32 +501,34 @@ def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='Doub
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
 
     References
     ----------
     Farbmacher, H., Guber, R. and Klaaßen, S. (2020). Instrument Validity Tests with Causal Forests. MEA Discussion
     Paper No. 13-2020. Available at SSRN: http://dx.doi.org/10.2139/ssrn.3619201.
     """
+    rng = _get_rng(random_state)
     # inspired by https://papers.ssrn.com/sol3/papers.cfm?abstract_id=3619201
-    xx = np.random.multivariate_normal(np.zeros(2),
-                                       np.array([[1., 0.3], [0.3, 1.]]),
-                                       size=[n_obs, ])
+    xx = _bivariate_normal(rng, 0.3, n_obs)
     u = xx[:, 0]
     v = xx[:, 1]
 
-    cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(0.5, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
-    beta = [1 / (k**2) for k in range(1, dim_x + 1)]
+    beta = 1. / np.arange(1, dim_x + 1)**2
 
-    z = np.random.binomial(p=0.5, n=1, size=[n_obs, ])
+    z = rng.binomial(p=0.5, n=1, size=[n_obs, ])
     d = 1. * (alpha_x * z + v > 0)
 
     y = d * theta + np.dot(x, beta) + u
 
     if return_type in _array_alias:
         return x, y, d, z
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         data = pd.DataFrame(np.column_stack((x, y, d, z)),
                             columns=x_cols + ['y', 'd', 'z'])
@@ -435,22 +540,24 @@ def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='Doub
         raise ValueError('Invalid return_type.')
 
 
-def _make_pliv_data(n_obs=100, dim_x=20, theta=0.5, gamma_z=0.4, return_type='DoubleMLData'):
-    b = [1/k for k in range(1, dim_x+1)]
-    sigma = make_spd_matrix(dim_x)
+def _make_pliv_data(n_obs=100, dim_x=20, theta=0.5, gamma_z=0.4, return_type='DoubleMLData', random_state=None):
+    rng = _get_rng(random_state)
+    b = 1. / np.arange(1, dim_x + 1)
+    sigma = _spd(dim_x, rng)
 
-    x = np.random.multivariate_normal(np.zeros(dim_x), sigma, size=[n_obs, ])
-    G = _g(np.dot(x, b))
+    x = _mvn(rng, sigma, n_obs)
+    x_b = np.dot(x, b)
+    G = _g(x_b)
     # instrument
-    z = _m(np.dot(x, b)) + np.random.standard_normal(size=[n_obs, ])
+    z = _m(x_b) + rng.standard_normal(size=[n_obs, ])
     # treatment
-    M = _m(gamma_z * z + np.dot(x, b))
-    d = M + np.random.standard_normal(size=[n_obs, ])
-    y = np.dot(theta, d) + G + np.random.standard_normal(size=[n_obs, ])
+    M = _m(gamma_z * z + x_b)
+    d = M + rng.standard_normal(size=[n_obs, ])
+    y = theta * d + G + rng.standard_normal(size=[n_obs, ])
 
     if return_type in _array_alias:
         return x, y, d, z
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         data = pd.DataFrame(np.column_stack((x, y, d, z)),
                             columns=x_cols + ['y', 'd', 'z'])
@@ -462,7 +569,7 @@ def _make_pliv_data(n_obs=100, dim_x=20, theta=0.5, gamma_z=0.4, return_type='Do
         raise ValueError('Invalid return_type.')
 
 
-def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='DoubleMLData'):
+def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='DoubleMLData', random_state=None):
     """
     Generates data from a partially linear IV regression model used in Chernozhukov, Hansen and Spindler (2015).
     The data generating process is defined as
@@ -505,42 +612,40 @@ def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='Double
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
 
     References
     ----------
     Chernozhukov, V., Hansen, C. and Spindler, M. (2015), Post-Selection and Post-Regularization Inference in Linear
     Models with Many Controls and Instruments. American Economic Review: Papers and Proceedings, 105 (5): 486-90.
     """
+    rng = _get_rng(random_state)
     assert dim_x >= dim_z
     # see https://assets.aeaweb.org/asset-server/articles-attachments/aer/app/10505/P2015_1022_app.pdf
-    xx = np.random.multivariate_normal(np.zeros(2),
-                                       np.array([[1., 0.6], [0.6, 1.]]),
-                                       size=[n_obs, ])
+    xx = _bivariate_normal(rng, 0.6, n_obs)
     epsilon = xx[:, 0]
     u = xx[:, 1]
 
-    sigma = toeplitz([np.power(0.5, k) for k in range(0, dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x),
-                                      sigma,
-                                      size=[n_obs, ])
+    sigma = toeplitz(np.power(0.5, np.arange(dim_x)))
+    x = _mvn(rng, sigma, n_obs)
 
-    I_z = np.eye(dim_z)
-    xi = np.random.multivariate_normal(np.zeros(dim_z),
-                                       0.25*I_z,
-                                       size=[n_obs, ])
+    xi = 0.5 * rng.standard_normal(size=[n_obs, dim_z])
 
-    beta = [1 / (k**2) for k in range(1, dim_x + 1)]
-    gamma = beta
-    delta = [1 / (k**2) for k in range(1, dim_z + 1)]
-    Pi = np.hstack((I_z, np.zeros((dim_z, dim_x-dim_z))))
+    beta = 1. / np.arange(1, dim_x + 1)**2
+    delta = 1. / np.arange(1, dim_z + 1)**2
 
-    z = np.dot(x, np.transpose(Pi)) + xi
-    d = np.dot(x, gamma) + np.dot(z, delta) + u
-    y = alpha * d + np.dot(x, beta) + epsilon
+    # Pi = [I_z, 0], i.e., x Pi' are the first dim_z covariates
+    z = x[:, :dim_z] + xi
+    # gamma = beta, hence the linear index in x is shared by d and y
+    x_beta = np.dot(x, beta)
+    d = x_beta + np.dot(z, delta) + u
+    y = alpha * d + x_beta + epsilon
 
     if return_type in _array_alias:
         return x, y, d, z
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         z_cols = [f'Z{i + 1}' for i in np.arange(dim_z)]
         data = pd.DataFrame(np.column_stack((x, y, d, z)),
@@ -553,7 +658,17 @@ def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='Double
         raise ValueError('Invalid return_type.')
 
 
-def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_type='DoubleMLClusterData', **kwargs):
+def _combine_cluster_levels(alpha, alpha_i, alpha_j, omega):
+    # (1 - omega_1 - omega_2) * alpha_ij + omega_1 * alpha_i + omega_2 * alpha_j for the N * M pairs ordered as
+    # (i, j) = (0, 0), (0, 1), ..., i.e., the broadcasting replaces np.repeat(alpha_i, M) and np.tile(alpha_j, N)
+    n_i, n_j = alpha_i.shape[0], alpha_j.shape[0]
+    res = (1 - omega[0] - omega[1]) * alpha.reshape((n_i, n_j) + alpha.shape[1:]) \
+        + omega[0] * alpha_i[:, np.newaxis] + omega[1] * alpha_j[np.newaxis, :]
+    return res.reshape(alpha.shape)
+
+
+def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_type='DoubleMLClusterData',
+                                        random_state=None, dtype=np.float64, **kwargs):
     """
     Generates data from a partially linear IV regression model with multiway cluster sample used in Chiang et al.
     (2021). The data generating process is defined as
@@ -616,6 +731,12 @@ def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s
         ``(x, y, d, cluster_vars, z)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
+    dtype :
+        Floating point type of the generated data, e.g. ``np.float32`` to halve the memory for large cluster
+        samples. Default is ``np.float64``.
     **kwargs
         Additional keyword arguments to set non-default values for the parameters
         :math:`\\pi_{10}=1.0`, :math:`\\omega_X = \\omega_{\\varepsilon} = \\omega_V = \\omega_v = (0.25, 0.25)`,
@@ -630,73 +751,52 @@ def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_
     doi: `10.1080/07350015.2021.1895815 <https://doi.org/10.1080/07350015.2021.1895815>`_,
     arXiv:`1909.03489 <https://arxiv.org/abs/1909.03489>`_.
     """
+    rng = _get_rng(random_state)
     # additional parameters specifiable via kwargs
     pi_10 = kwargs.get('pi_10', 1.0)
 
+    # all coefficients are cast to dtype, such that the generated data is not upcast
     xx = np.arange(1, dim_X + 1)
-    zeta_0 = kwargs.get('zeta_0', np.power(0.5, xx))
-    pi_20 = kwargs.get('pi_20', np.power(0.5, xx))
-    xi_0 = kwargs.get('xi_0', np.power(0.5, xx))
+    zeta_0 = np.asarray(kwargs.get('zeta_0', np.power(0.5, xx)), dtype=dtype)
+    pi_20 = np.asarray(kwargs.get('pi_20', np.power(0.5, xx)), dtype=dtype)
+    xi_0 = np.asarray(kwargs.get('xi_0', np.power(0.5, xx)), dtype=dtype)
 
-    omega_X = kwargs.get('omega_X', np.array([0.25, 0.25]))
-    omega_epsilon = kwargs.get('omega_epsilon', np.array([0.25, 0.25]))
-    omega_v = kwargs.get('omega_v', np.array([0.25, 0.25]))
-    omega_V = kwargs.get('omega_V', np.array([0.25, 0.25]))
+    omega_X = np.asarray(kwargs.get('omega_X', np.array([0.25, 0.25])), dtype=dtype)
+    omega_epsilon = np.asarray(kwargs.get('omega_epsilon', np.array([0.25, 0.25])), dtype=dtype)
+    omega_v = np.asarray(kwargs.get('omega_v', np.array([0.25, 0.25])), dtype=dtype)
+    omega_V = np.asarray(kwargs.get('omega_V', np.array([0.25, 0.25])), dtype=dtype)
 
     s_X = kwargs.get('s_X', 0.25)
     s_epsilon_v = kwargs.get('s_epsilon_v', 0.25)
 
-    # use np.tile() and np.repeat() for repeating vectors in different styles, i.e.,
-    # np.tile([v1, v2, v3], 2) [v1, v2, v3, v1, v2, v3]
-    # np.repeat([v1, v2, v3], 2) [v1, v1, v2, v2, v3, v3]
-
-    alpha_V = np.random.normal(size=(N * M))
-    alpha_V_i = np.repeat(np.random.normal(size=N), M)
-    alpha_V_j = np.tile(np.random.normal(size=M), N)
-
-    cov_mat = np.array([[1, s_epsilon_v], [s_epsilon_v, 1]])
-    alpha_eps_v = np.random.multivariate_normal(np.zeros(2), cov_mat, size=[N * M, ])
-    alpha_eps = alpha_eps_v[:, 0]
-    alpha_v = alpha_eps_v[:, 1]
+    # the pair, first and second cluster level are drawn at once and split afterwards, i.e., rows
+    # [0, N * M), [N * M, N * M + N) and [N * M + N, N * M + N + M)
+    alpha_V_all = rng.standard_normal(size=N * M + N + M, dtype=dtype)
+    alpha_V, alpha_V_i, alpha_V_j = np.split(alpha_V_all, [N * M, N * M + N])
 
-    alpha_eps_v_i = np.random.multivariate_normal(np.zeros(2), cov_mat, size=[N, ])
-    alpha_eps_i = np.repeat(alpha_eps_v_i[:, 0], M)
-    alpha_v_i = np.repeat(alpha_eps_v_i[:, 1], M)
+    alpha_eps_v_all = _bivariate_normal(rng, s_epsilon_v, N * M + N + M, dtype=dtype)
+    alpha_eps_v, alpha_eps_v_i, alpha_eps_v_j = np.split(alpha_eps_v_all, [N * M, N * M + N])
 
-    alpha_eps_v_j = np.random.multivariate_normal(np.zeros(2), cov_mat, size=[M, ])
-    alpha_eps_j = np.tile(alpha_eps_v_j[:, 0], N)
-    alpha_v_j = np.tile(alpha_eps_v_j[:, 1], N)
-
-    cov_mat = toeplitz([np.power(s_X, k) for k in range(dim_X)])
-    alpha_X = np.random.multivariate_normal(np.zeros(dim_X), cov_mat, size=[N * M, ])
-    alpha_X_i = np.repeat(np.random.multivariate_normal(np.zeros(dim_X), cov_mat, size=[N, ]),
-                          M, axis=0)
-    alpha_X_j = np.tile(np.random.multivariate_normal(np.zeros(dim_X), cov_mat, size=[M, ]),
-                        (N, 1))
+    alpha_X_all = _mvn(rng, toeplitz(np.power(s_X, np.arange(dim_X))), N * M + N + M, dtype=dtype)
+    alpha_X, alpha_X_i, alpha_X_j = np.split(alpha_X_all, [N * M, N * M + N])
 
     # generate variables
-    x = (1 - omega_X[0] - omega_X[1]) * alpha_X \
-        + omega_X[0] * alpha_X_i + omega_X[1] * alpha_X_j
-
-    eps = (1 - omega_epsilon[0] - omega_epsilon[1]) * alpha_eps \
-        + omega_epsilon[0] * alpha_eps_i + omega_epsilon[1] * alpha_eps_j
-
-    v = (1 - omega_v[0] - omega_v[1]) * alpha_v \
-        + omega_v[0] * alpha_v_i + omega_v[1] * alpha_v_j
-
-    V = (1 - omega_V[0] - omega_V[1]) * alpha_V \
-        + omega_V[0] * alpha_V_i + omega_V[1] * alpha_V_j
+    x = _combine_cluster_levels(alpha_X, alpha_X_i, alpha_X_j, omega_X)
+    eps = _combine_cluster_levels(alpha_eps_v[:, 0], alpha_eps_v_i[:, 0], alpha_eps_v_j[:, 0], omega_epsilon)
+    v = _combine_cluster_levels(alpha_eps_v[:, 1], alpha_eps_v_i[:, 1], alpha_eps_v_j[:, 1], omega_v)
+    V = _combine_cluster_levels(alpha_V, alpha_V_i, alpha_V_j, omega_V)
 
     z = np.matmul(x, xi_0) + V
-    d = z * pi_10 + np.matmul(x, pi_20) + v
-    y = d * theta + np.matmul(x, zeta_0) + eps
+    d = z * float(pi_10) + np.matmul(x, pi_20) + v
+    y = d * float(theta) + np.matmul(x, zeta_0) + eps
 
     cluster_cols = ['cluster_var_i', 'cluster_var_j']
-    cluster_vars = pd.MultiIndex.from_product([range(N), range(M)]).to_frame(name=cluster_cols).reset_index(drop=True)
+    cluster_vars = pd.DataFrame({cluster_cols[0]: np.repeat(np.arange(N), M),
+                                 cluster_cols[1]: np.tile(np.arange(M), N)})
 
     if return_type in _array_alias:
         return x, y, d, cluster_vars.values, z
-    elif return_type in _data_frame_alias + _dml_cluster_data_alias:
+    elif return_type in _data_frame_or_dml_cluster_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_X)]
         data = pd.concat((cluster_vars,
                           pd.DataFrame(np.column_stack((x, y, d, z)), columns=x_cols + ['Y', 'D', 'Z'])),
@@ -709,7 +809,8 @@ def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_
         raise ValueError('Invalid return_type.')
 
 
-def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_type='DoubleMLData', **kwargs):
+def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_type='DoubleMLData', random_state=None,
+                    **kwargs):
     """
     Generates data from a difference-in-differences model used in Sant'Anna and Zhao (2020).
     The data generating process is defined as follows. For a generic :math:`W=(W_1, W_2, W_3, W_4)^T`, let
@@ -785,6 +886,9 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``
         or ``(x, y, d, t)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
     **kwargs
         Additional keyword arguments to set non-default values for the parameter
         :math:`xi=0.75`, :math:`c=0.0` and :math:`\\lambda_T=0.5`.
@@ -795,6 +899,7 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
     Doubly robust difference-in-differences estimators. Journal of Econometrics, 219(1), 101-122.
     doi:`10.1016/j.jeconom.2020.06.003 <https://doi.org/10.1016/j.jeconom.2020.06.003>`_.
     """
+    rng = _get_rng(random_state)
     xi = kwargs.get('xi', 0.75)
     c = kwargs.get('c', 0.0)
     lambda_t = kwargs.get('lambda_t', 0.5)
@@ -808,8 +913,8 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
         return res
 
     dim_x = 4
-    cov_mat = toeplitz([np.power(c, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(c, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
     z_tilde_1 = np.exp(0.5*x[:, 0])
     z_tilde_2 = 10 + x[:, 1] / (1 + np.exp(x[:, 0]))
@@ -820,8 +925,8 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
     z = (z_tilde - np.mean(z_tilde, axis=0)) / np.std(z_tilde, axis=0)
 
     # error terms
-    epsilon_0 = np.random.normal(loc=0, scale=1, size=n_obs)
-    epsilon_1 = np.random.normal(loc=0, scale=1, size=[n_obs, 2])
+    epsilon_0 = rng.normal(loc=0, scale=1, size=n_obs)
+    epsilon_1 = rng.normal(loc=0, scale=1, size=[n_obs, 2])
 
     if dgp_type == 1:
         features_ps = z
@@ -851,11 +956,11 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
         p = 0.5 * np.ones(n_obs)
     else:
         p = np.exp(f_ps(features_ps, xi)) / (1 + np.exp(f_ps(features_ps, xi)))
-    u = np.random.uniform(low=0, high=1, size=n_obs)
+    u = rng.uniform(low=0, high=1, size=n_obs)
     d = 1.0 * (p >= u)
 
     # potential outcomes
-    nu = np.random.normal(loc=d*f_reg(features_reg), scale=1, size=n_obs)
+    nu = rng.normal(loc=d*f_reg(features_reg), scale=1, size=n_obs)
     y0 = f_reg(features_reg) + nu + epsilon_0
     y1_d0 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 0]
     y1_d1 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 1]
@@ -866,7 +971,7 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
 
         if return_type in _array_alias:
             return z, y, d
-        elif return_type in _data_frame_alias + _dml_data_alias:
+        elif return_type in _data_frame_or_dml_data_alias:
             z_cols = [f'Z{i + 1}' for i in np.arange(dim_x)]
             data = pd.DataFrame(np.column_stack((z, y, d)),
                                 columns=z_cols + ['y', 'd'])
@@ -878,13 +983,13 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
             raise ValueError('Invalid return_type.')
 
     else:
-        u_t = np.random.uniform(low=0, high=1, size=n_obs)
+        u_t = rng.uniform(low=0, high=1, size=n_obs)
         t = 1.0 * (u_t <= lambda_t)
         y = t * y1 + (1-t)*y0
 
         if return_type in _array_alias:
             return z, y, d, t
-        elif return_type in _data_frame_alias + _dml_data_alias:
+        elif return_type in _data_frame_or_dml_data_alias:
             z_cols = [f'Z{i + 1}' for i in np.arange(dim_x)]
             data = pd.DataFrame(np.column_stack((z, y, d, t)),
                                 columns=z_cols + ['y', 'd', 't'])
@@ -896,7 +1001,7 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
             raise ValueError('Invalid return_type.')
 
 
-def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, linear=False, **kwargs):
+def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, linear=False, random_state=None, **kwargs):
     """
     Generates counfounded data from an interactive regression model.
 
@@ -987,6 +1092,10 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
     linear : bool
         If ``True``, the Z will be set to X, such that the underlying (short) models are linear/logistic.
         Default is ``False``.
+    random_state : None, int, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator`
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
+        Default is ``None``.
 
     Returns
     -------
@@ -999,6 +1108,7 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
     Doubly robust difference-in-differences estimators. Journal of Econometrics, 219(1), 101-122.
     doi:`10.1016/j.jeconom.2020.06.003 <https://doi.org/10.1016/j.jeconom.2020.06.003>`_.
     """
+    rng = _get_rng(random_state)
     c = 0.0  # the confounding strength is only valid for c=0
     xi = 0.75
     dim_x = kwargs.get('dim_x', 5)
@@ -1015,8 +1125,8 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
         res = xi*(-w[:, 0] + 0.1*w[:, 1] - 0.25*w[:, 2] - 0.1*w[:, 3])
         return res
     # observed covariates
-    cov_mat = toeplitz([np.power(c, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(c, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
     z_tilde_1 = np.exp(0.5*x[:, 0])
     z_tilde_2 = 10 + x[:, 1] / (1 + np.exp(x[:, 0]))
     z_tilde_3 = (0.6 + x[:, 0] * x[:, 2]/25)**3
@@ -1025,10 +1135,10 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
     z_tilde = np.column_stack((z_tilde_1, z_tilde_2, z_tilde_3, z_tilde_4, z_tilde_5))
     z = (z_tilde - np.mean(z_tilde, axis=0)) / np.std(z_tilde, axis=0)
     # error terms and unobserved confounder
-    eps_y = np.random.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
+    eps_y = rng.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
     # unobserved confounder
     a_bounds = (-1, 1)
-    a = np.random.uniform(low=a_bounds[0], high=a_bounds[1], size=n_obs)
+    a = rng.uniform(low=a_bounds[0], high=a_bounds[1], size=n_obs)
     var_a = np.square(a_bounds[1] - a_bounds[0]) / 12
 
     # Choose the features used in the models
@@ -1050,7 +1160,7 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
         warnings.warn(f'Propensity score is close to 0 or 1. '
                       f'Trimming is at {trimming_threshold} and {1.0-trimming_threshold} is applied')
     # generate treatment based on long form
-    u = np.random.uniform(low=0, high=1, size=n_obs)
+    u = rng.uniform(low=0, high=1, size=n_obs)
     d = 1.0 * (m_long >= u)
     # add treatment heterogeneity
     d1x = z[:, 4] + 1
@@ -1119,7 +1229,7 @@ def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, l
     return res_dict
 
 
-def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, **kwargs):
+def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, random_state=None, **kwargs):
     """
     Generates counfounded data from an partially linear regression model.
 
@@ -1196,6 +1306,10 @@ def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, **kwarg
     cf_d : float
         Percentage gains in the variation of the Riesz Representer generated by latent/confounding variable.
         Default is ``0.04``.
+    random_state : None, int, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator`
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
+        Default is ``None``.
 
     Returns
     -------
@@ -1208,12 +1322,13 @@ def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, **kwarg
     Doubly robust difference-in-differences estimators. Journal of Econometrics, 219(1), 101-122.
     doi:`10.1016/j.jeconom.2020.06.003 <https://doi.org/10.1016/j.jeconom.2020.06.003>`_.
     """
+    rng = _get_rng(random_state)
     c = kwargs.get('c', 0.0)
     dim_x = kwargs.get('dim_x', 4)
 
     # observed covariates
-    cov_mat = toeplitz([np.power(c, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(c, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
     z_tilde_1 = np.exp(0.5*x[:, 0])
     z_tilde_2 = 10 + x[:, 1] / (1 + np.exp(x[:, 0]))
@@ -1225,13 +1340,13 @@ def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, **kwarg
 
     # error terms
     var_eps_y = 5
-    eps_y = np.random.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
+    eps_y = rng.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
     var_eps_d = 1
-    eps_d = np.random.normal(loc=0, scale=np.sqrt(var_eps_d), size=n_obs)
+    eps_d = rng.normal(loc=0, scale=np.sqrt(var_eps_d), size=n_obs)
 
     # unobserved confounder
     a_bounds = (-1, 1)
-    a = np.random.uniform(low=a_bounds[0], high=a_bounds[1], size=n_obs)
+    a = rng.uniform(low=a_bounds[0], high=a_bounds[1], size=n_obs)
     var_a = np.square(a_bounds[1] - a_bounds[0]) / 12
 
     # get the required impact of the confounder on the propensity score
@@ -1282,7 +1397,7 @@ def make_confounded_plr_data(n_obs=500, theta=5.0, cf_y=0.04, cf_d=0.04, **kwarg
     return res_dict
 
 
-def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treatment=False):
+def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treatment=False, random_state=None):
     """
     Creates a simple synthetic example for heterogeneous treatment effects.
     The data generating process is based on the Monte Carlo simulation from Oprescu et al. (2019).
@@ -1339,12 +1454,18 @@ def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treat
         Indicates whether the treatment is binary.
         Default is ``False``.
 
+    random_state : None, int, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator`
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
+        Default is ``None``.
+
     Returns
     -------
     res_dict : dictionary
        Dictionary with entries ``data``, ``effects``, ``treatment_effect``.
 
     """
+    rng = _get_rng(random_state)
     # simple input checks
     assert n_x in [1, 2], 'n_x must be either 1 or 2.'
     assert support_size <= p, 'support_size must be smaller than p.'
@@ -1362,18 +1483,18 @@ def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treat
             return np.exp(2 * x[:, 0]) + 3 * np.sin(4 * x[:, 1])
 
     # Outcome support and coefficients
-    support_y = np.random.choice(np.arange(p), size=support_size, replace=False)
-    coefs_y = np.random.uniform(0, 1, size=support_size)
+    support_y = rng.choice(np.arange(p), size=support_size, replace=False)
+    coefs_y = rng.uniform(0, 1, size=support_size)
     # treatment support and coefficients
     support_d = support_y
-    coefs_d = np.random.uniform(0, 0.3, size=support_size)
+    coefs_d = rng.uniform(0, 0.3, size=support_size)
 
     # noise
-    epsilon = np.random.uniform(-1, 1, size=n_obs)
-    eta = np.random.uniform(-1, 1, size=n_obs)
+    epsilon = rng.uniform(-1, 1, size=n_obs)
+    eta = rng.uniform(-1, 1, size=n_obs)
 
     # Generate controls, covariates, treatments and outcomes
-    x = np.random.uniform(0, 1, size=(n_obs, p))
+    x = rng.uniform(0, 1, size=(n_obs, p))
     # Heterogeneous treatment effects
     te = treatment_effect(x)
     if binary_treatment:
@@ -1399,7 +1520,7 @@ def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treat
     return res_dict
 
 
-def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleMLData'):
+def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleMLData', random_state=None):
     """
     Generates data from a sample selection model (SSM).
     The data generating process is defined as
@@ -1440,28 +1561,32 @@ def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleM
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z, s)``.
+    random_state :
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
 
     References
     ----------
     Michela Bia, Martin Huber & Lukáš Lafférs (2023) Double Machine Learning for Sample Selection Models,
     Journal of Business & Economic Statistics, DOI: 10.1080/07350015.2023.2271071
     """
+    rng = _get_rng(random_state)
     if mar:
-        sigma = np.array([[1, 0], [0, 1]])
+        rho = 0.
         gamma = 0
     else:
-        sigma = np.array([[1, 0.8], [0.8, 1]])
+        rho = 0.8
         gamma = 1
 
-    e = np.random.multivariate_normal(mean=[0, 0], cov=sigma, size=n_obs).T
+    e = _bivariate_normal(rng, rho, n_obs).T
 
-    cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(0.5, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
     beta = [0.4 / (k**2) for k in range(1, dim_x + 1)]
 
-    d = np.where(np.dot(x, beta) + np.random.randn(n_obs) > 0, 1, 0)
-    z = np.random.randn(n_obs)
+    d = np.where(np.dot(x, beta) + rng.standard_normal(n_obs) > 0, 1, 0)
+    z = rng.standard_normal(n_obs)
     s = np.where(np.dot(x, beta) + d + gamma * z + e[0] > 0, 1, 0)
 
     y = np.dot(x, beta) + theta * d + e[1]
@@ -1469,7 +1594,7 @@ def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleM
 
     if return_type in _array_alias:
         return x, y, d, z, s
-    elif return_type in _data_frame_alias + _dml_data_alias:
+    elif return_type in _data_frame_or_dml_data_alias:
         x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
         if mar:
             data = pd.DataFrame(np.column_stack((x, y, d, s)),
@@ -1559,9 +1684,10 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
         Indicates whether the true underlying regression is linear.
         Default is ``False``.
 
-    random_state : int
-        Random seed for reproducibility.
-        Default is ``42``.
+    random_state : None, int, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator`
+        Seed, :class:`numpy.random.SeedSequence` or :class:`numpy.random.Generator` used to draw the data.
+        If ``None``, the seed is drawn from the global numpy random state.
+        Default is ``None``.
 
     Returns
     -------
@@ -1571,8 +1697,7 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
        and the potential outcome without treatment.
 
     """
-    if random_state is not None:
-        np.random.seed(random_state)
+    rng = _get_rng(random_state)
     xi = kwargs.get('xi', 0.3)
     c = kwargs.get('c', 0.0)
     dim_x = kwargs.get('dim_x', 5)
@@ -1583,8 +1708,8 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
         raise ValueError('n_levels must be at least 2.')
 
     # observed covariates
-    cov_mat = toeplitz([np.power(c, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
+    cov_mat = toeplitz(np.power(c, np.arange(dim_x)))
+    x = _mvn(rng, cov_mat, n_obs)
 
     def f_reg(w):
         res = 210 + 27.4*w[:, 0] + 13.7*(w[:, 1] + w[:, 2] + w[:, 3])
@@ -1607,9 +1732,9 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
 
     # error terms
     var_eps_y = 5
-    eps_y = np.random.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
+    eps_y = rng.normal(loc=0, scale=np.sqrt(var_eps_y), size=n_obs)
     var_eps_d = 1
-    eps_d = np.random.normal(loc=0, scale=np.sqrt(var_eps_d), size=n_obs)
+    eps_d = rng.normal(loc=0, scale=np.sqrt(var_eps_d), size=n_obs)
 
     if linear:
         g = f_reg(x)
@@ -1622,7 +1747,7 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
     cont_d = m + eps_d
     level_bounds = np.quantile(cont_d, q=np.linspace(0, 1, n_levels + 1))
     potential_level = sum([1.0 * (cont_d >= bound) for bound in level_bounds[1:-1]]) + 1
-    eta = np.random.uniform(0, 1, size=n_obs)
+    eta = rng.uniform(0, 1, size=n_obs)
     d = 1.0 * (eta >= 1/n_levels) * potential_level
 
     ite = treatment_effect(cont_d)
@@ -1646,3 +1771,46 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
     }
 
     return resul_dict
+
+
+def make_batch(fn, n_reps, *args, n_jobs=None, seed=None, **kwargs):
+    """
+    Generates independent replications of a data generating process, e.g. for Monte Carlo simulations.
+
+    Each replication ``i`` is generated by calling ``fn(*args, random_state=ss_i, **kwargs)``, where the seed sequences
+    ``ss_i`` are spawned from ``np.random.SeedSequence(seed)``. The replications are therefore statistically
+    independent and reproducible, irrespective of the number of jobs.
+
+    Parameters
+    ----------
+    fn : callable
+        A data generating function with a ``random_state`` argument, e.g. :py:func:`doubleml.datasets.make_irm_data`.
+    n_reps : int
+        The number of replications.
+    *args
+        Positional arguments passed to ``fn``.
+    n_jobs : None or int
+        The number of CPUs to use for generating the replications. ``None`` means ``1``.
+        Default is ``None``.
+    seed : None or int
+        Seed of the :class:`numpy.random.SeedSequence` from which the replications are spawned.
+        Default is ``None``.
+    **kwargs
+        Keyword arguments passed to ``fn``.
+
+    Returns
+    -------
+    res : list
+        List of length ``n_reps`` with the return values of ``fn``.
+    """
+    if not isinstance(n_reps, int):
+        raise TypeError('The number of replications n_reps must be of int type. '
+                        f'{str(n_reps)} of type {str(type(n_reps))} was passed.')
+    if n_reps < 1:
+        raise ValueError('The number of replications n_reps must be positive. '
+                         f'{str(n_reps)} was passed.')
+    seed_seqs = np.random.SeedSequence(seed).spawn(n_reps)
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    res = parallel(delayed(fn)(*args, random_state=seed_seqs[i_rep], **kwargs)
+                   for i_rep in range(n_reps))
+    return res
@@ -180,7 +180,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
                              'At the moment there are not DiD models with instruments implemented.')
         one_treat = (obj_dml_data.n_treat == 1)
         binary_treat = (type_of_target(obj_dml_data.d) == 'binary')
-        zero_one_treat = np.all((np.power(obj_dml_data.d, 2) - obj_dml_data.d) == 0)
+        zero_one_treat = np.all((obj_dml_data.d == 0) | (obj_dml_data.d == 1))
         if not (one_treat & binary_treat & zero_one_treat):
             raise ValueError('Incompatible data. '
                              'To fit an DID model with DML '
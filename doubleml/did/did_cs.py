@@ -183,8 +183,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                              'At the moment there are no DiD models with instruments implemented.')
         one_treat = (obj_dml_data.n_treat == 1)
         binary_treat = (type_of_target(obj_dml_data.d) == 'binary')
-        zero_one_treat = np.all(
-            (np.power(obj_dml_data.d, 2) - obj_dml_data.d) == 0)
+        zero_one_treat = np.all((obj_dml_data.d == 0) | (obj_dml_data.d == 1))
         if not (one_treat & binary_treat & zero_one_treat):
             raise ValueError('Incompatible data. '
                              'To fit an DIDCS model with DML '
@@ -192,8 +191,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                              'needs to be specified as treatment variable.')
 
         binary_time = (type_of_target(obj_dml_data.t) == 'binary')
-        zero_one_time = np.all(
-            (np.power(obj_dml_data.t, 2) - obj_dml_data.t) == 0)
+        zero_one_time = np.all((obj_dml_data.t == 0) | (obj_dml_data.t == 1))
 
         if not (binary_time & zero_one_time):
             raise ValueError('Incompatible data. '
@@ -19,10 +19,20 @@ def n_rep(request):
 
 
 @pytest.fixture(scope="module")
-def doubleml_didcs_fixture(did_score, n_rep):
+def dml_data_did_cs():
+    return make_did_SZ2020(n_obs=500, cross_sectional_data=True, return_type="DoubleMLData")
+
+
+@pytest.fixture(scope="module")
+def did_cs_smpls(dml_data_did_cs, n_rep):
+    return draw_smpls(len(dml_data_did_cs.y), 5, n_rep=n_rep, groups=dml_data_did_cs.d)
+
+
+@pytest.fixture(scope="module")
+def doubleml_didcs_fixture(dml_data_did_cs, did_cs_smpls, did_score, n_rep):
     ext_predictions = {"d": {}}
-    dml_data = make_did_SZ2020(n_obs=500, cross_sectional_data=True, return_type="DoubleMLData")
-    all_smpls = draw_smpls(len(dml_data.y), 5, n_rep=n_rep, groups=dml_data.d)
+    dml_data = dml_data_did_cs
+    all_smpls = did_cs_smpls
     kwargs = {
         "obj_dml_data": dml_data,
         "score": did_score,
@@ -654,14 +654,14 @@ class DoubleMLData(DoubleMLBaseData):
         for treatment_var in self.d_cols:
             this_d = self.data.loc[:, treatment_var]
             binary_treat = (type_of_target(this_d) == 'binary')
-            zero_one_treat = np.all((np.power(this_d, 2) - this_d) == 0)
+            zero_one_treat = np.all((this_d == 0) | (this_d == 1))
             is_binary[treatment_var] = (binary_treat & zero_one_treat)
         return is_binary
 
     def _check_binary_outcome(self):
         y = self.data.loc[:, self.y_col]
         binary_outcome = (type_of_target(y) == 'binary')
-        zero_one_outcome = np.all((np.power(y, 2) - y) == 0)
+        zero_one_outcome = np.all((y == 0) | (y == 1))
         is_binary = (binary_outcome & zero_one_outcome)
         return is_binary
 
@@ -100,6 +100,13 @@ class NonLinearScoreMixin:
     def _compute_score_deriv(self, psi_elements, coef):
         pass
 
+    def _get_score_fun(self, psi_elements):
+        # the score as a function of the parameter, which is evaluated repeatedly during the root search
+        # (can be overwritten to precompute all parts of the score which do not depend on the parameter)
+        def score_fun(coef):
+            return self._compute_score(psi_elements, coef)
+        return score_fun
+
     def _est_coef(self, psi_elements, smpls=None, scaling_factor=None, inds=None):
         # if the calculation is only done on a subset of observations
         if inds is not None:
@@ -127,9 +134,11 @@ class NonLinearScoreMixin:
 
             return psi_mean
 
+        score_fun = self._get_score_fun(psi_elements)
+
         # calculation of the score for a parameter theta
         def score(theta):
-            psi = self._compute_score(psi_elements, theta)
+            psi = score_fun(theta)
 
             return _aggregate_obs(psi)
 
@@ -167,7 +176,7 @@ class NonLinearScoreMixin:
             else:
                 # try to find an alternative start value
                 def score_squared(theta):
-                    res = np.power(np.mean(self._compute_score(psi_elements, theta)), 2)
+                    res = np.power(np.mean(score_fun(theta)), 2)
                     return res
                 # def score_squared_deriv(theta, inds):
                 #     res = 2 * np.mean(self._compute_score(psi_elements, theta, inds)) * \
@@ -197,7 +206,7 @@ class NonLinearScoreMixin:
                                       'No theta found such that the score function evaluates to a negative value.')
                     else:
                         def neg_score(theta):
-                            res = - np.mean(self._compute_score(psi_elements, theta))
+                            res = - np.mean(score_fun(theta))
                             return res
                         theta_hat, neg_score_val, _ = fmin_l_bfgs_b(neg_score,
                                                                     self._coef_start_val,
@@ -6,7 +6,7 @@ from sklearn.model_selection import StratifiedKFold, train_test_split
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import LinearScoreMixin
 from ..utils._estimation import _dml_cv_predict, _trimm, _predict_zero_one_propensity, \
-    _normalize_ipw, _dml_tune, _get_bracket_guess, _solve_ipw_score, _cond_targets
+    _normalize_ipw, _dml_tune, _solve_weighted_ipw_score, _cond_targets
 from ..double_ml_data import DoubleMLData
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, \
     _check_contains_iv, _check_quantile
@@ -172,9 +172,9 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         """
         return self._trimming_threshold
 
-    def _compute_ipw_score(self, theta, d, y, prop):
-        score = (d == self.treatment) / prop * (y <= theta) - self.quantile
-        return score
+    def _compute_ipw_weights(self, d, prop):
+        weights = (d == self.treatment) / prop
+        return weights
 
     def _score_elements(self, y, d, g_hat, m_hat, pq_est):
         # recalculate the target for g based on the pq_est
@@ -246,12 +246,8 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
                 m_hat_prelim = 1 - m_hat_prelim
 
             # preliminary ipw estimate
-            def ipw_score(theta):
-                res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
-                return res
-
-            _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+            ipw_weights = self._compute_ipw_weights(d_train_1, m_hat_prelim)
+            ipw_est = _solve_weighted_ipw_score(y_train_1, ipw_weights, self.quantile, self._coef_start_val)
             ipw_vec[i_fold] = ipw_est
 
             # use the preliminary estimates to fit the nuisance parameters on train_2
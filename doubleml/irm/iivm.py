@@ -219,7 +219,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                             f'{str(obj_dml_data)} of type {str(type(obj_dml_data))} was passed.')
         one_treat = (obj_dml_data.n_treat == 1)
         binary_treat = (type_of_target(obj_dml_data.d) == 'binary')
-        zero_one_treat = np.all((np.power(obj_dml_data.d, 2) - obj_dml_data.d) == 0)
+        zero_one_treat = np.all((obj_dml_data.d == 0) | (obj_dml_data.d == 1))
         if not (one_treat & binary_treat & zero_one_treat):
             raise ValueError('Incompatible data. '
                              'To fit an IIVM model with DML '
@@ -232,7 +232,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                    'needs to be specified as instrumental variable.')
         if one_instr:
             binary_instr = (type_of_target(obj_dml_data.z) == 'binary')
-            zero_one_instr = np.all((np.power(obj_dml_data.z, 2) - obj_dml_data.z) == 0)
+            zero_one_instr = np.all((obj_dml_data.z == 0) | (obj_dml_data.z == 1))
             if not (one_instr & binary_instr & zero_one_instr):
                 raise ValueError(err_msg)
         else:
@@ -3,6 +3,7 @@ from sklearn.utils.multiclass import type_of_target
 from sklearn.base import clone
 from sklearn.utils import check_X_y
 from sklearn.model_selection import StratifiedKFold, train_test_split
+from joblib import Parallel, delayed
 
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import NonLinearScoreMixin
@@ -13,11 +14,10 @@ from ..utils._estimation import (
     _trimm,
     _predict_zero_one_propensity,
     _cond_targets,
-    _get_bracket_guess,
     _default_kde,
     _normalize_ipw,
     _dml_tune,
-    _solve_ipw_score,
+    _solve_weighted_ipw_score,
 )
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, _check_quantile
 
@@ -66,8 +66,8 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted gaussian kernel density estimate directly in ``0``, with
+        silverman's rule of thumb for bandwidth determination.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -222,13 +222,11 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
     def _score_element_names(self):
         return ["ind_d", "m_z", "g_du_z0", "g_du_z1", "y", "z", "comp_prob"]
 
-    def _compute_ipw_score(self, theta, d, y, prop, z, comp_prob):
+    def _compute_ipw_weights(self, d, prop, z, comp_prob):
+        # the ipw score is given by weights * 1{y <= theta} - quantile
         sign = 2 * self.treatment - 1.0
-        weights = sign * (z / prop - (1 - z) / (1 - prop)) / comp_prob
-        u = (d == self._treatment) * (y <= theta)
-        v = -1.0 * self.quantile
-        score = weights * u + v
-        return score
+        weights = sign * (z / prop - (1 - z) / (1 - prop)) / comp_prob * (d == self._treatment)
+        return weights
 
     def _compute_score(self, psi_elements, coef, inds=None):
         sign = 2 * self.treatment - 1.0
@@ -242,18 +240,37 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
 
         if inds is not None:
             ind_d = psi_elements["ind_d"][inds]
-            m_z = psi_elements["m_z"]
+            m_z = psi_elements["m_z"][inds]
             g_du_z0 = psi_elements["g_du_z0"][inds]
             g_du_z1 = psi_elements["g_du_z1"][inds]
             y = psi_elements["y"][inds]
             z = psi_elements["z"][inds]
 
-        score1 = g_du_z1 - g_du_z0
-        score2 = (z / m_z) * (ind_d * (y <= coef) - g_du_z1)
-        score3 = (1 - z) / (1 - m_z) * (ind_d * (y <= coef) - g_du_z0)
-        score = sign * (score1 + score2 - score3) / comp_prob - self.quantile
+        # the indicator is shared by both correction terms; the score is accumulated in place
+        ind_du = ind_d * (y <= coef)
+        score = g_du_z1 - g_du_z0
+        score += z / m_z * (ind_du - g_du_z1)
+        score -= (1 - z) / (1 - m_z) * (ind_du - g_du_z0)
+        score *= sign / comp_prob
+        score -= self.quantile
         return score
 
+    def _get_score_fun(self, psi_elements):
+        # the score is affine in the indicator ind_d * (y <= coef), such that all other terms are computed only once
+        sign = 2 * self.treatment - 1.0
+        w_z1 = psi_elements["z"] / psi_elements["m_z"]
+        w_z0 = (1 - psi_elements["z"]) / (1 - psi_elements["m_z"])
+        g_du_z0 = psi_elements["g_du_z0"]
+        g_du_z1 = psi_elements["g_du_z1"]
+        scale = sign / psi_elements["comp_prob"]
+        score_const = scale * (g_du_z1 - g_du_z0 - w_z1 * g_du_z1 + w_z0 * g_du_z0) - self.quantile
+        score_slope = scale * (w_z1 - w_z0) * psi_elements["ind_d"]
+        y = psi_elements["y"]
+
+        def score_fun(coef):
+            return score_const + score_slope * (y <= coef)
+        return score_fun
+
     def _compute_score_deriv(self, psi_elements, coef, inds=None):
         sign = 2 * self.treatment - 1.0
         ind_d = psi_elements["ind_d"]
@@ -296,20 +313,21 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         strata = self._dml_data.d.reshape(-1, 1) + 2 * self._dml_data.z.reshape(-1, 1)
 
         # initialize nuisance predictions, targets and models
+        # (the targets of m_z, m_d_z0 and m_d_z1 do not depend on the folds and are set after the cross-fitting)
         if not all(ext_preds):
             m_z_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
             }
             m_d_z0_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
             }
             m_d_z1_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
             }
             g_du_z0_hat = {
@@ -340,17 +358,17 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         else:
             m_z_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": external_predictions["ml_m_z"],
             }
             m_d_z0_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": external_predictions["ml_m_d_z0"],
             }
             m_d_z1_hat = {
                 "models": None,
-                "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                "targets": None,
                 "preds": external_predictions["ml_m_d_z1"],
             }
             g_du_z0_hat = {
@@ -364,129 +382,31 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 "preds": external_predictions["ml_g_du_z1"],
             }
 
-        # calculate nuisance functions over different folds
+        # calculate nuisance functions over different folds (the folds are independent and can be fitted in parallel)
         if not all(ext_preds):
-            for i_fold in range(self.n_folds):
-                train_inds = smpls[i_fold][0]
-                test_inds = smpls[i_fold][1]
-
-                # start nested crossfitting
-                train_inds_1, train_inds_2 = train_test_split(
-                    train_inds, test_size=0.5, random_state=42, stratify=strata[train_inds]
-                )
-                smpls_prelim = [
-                    (train, test)
-                    for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=strata[train_inds_1])
-                ]
-
-                d_train_1 = d[train_inds_1]
-                y_train_1 = y[train_inds_1]
-                x_train_1 = x[train_inds_1, :]
-                z_train_1 = z[train_inds_1]
-
-                # preliminary propensity for z
-                ml_m_z_prelim = clone(fitted_models["ml_m_z"][i_fold])
-                m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
-                                                 method="predict_proba", smpls=smpls_prelim)[
-                    "preds"
-                ]
-
-                m_z_hat_prelim = _trimm(m_z_hat_prelim, self.trimming_rule, self.trimming_threshold)
-                if self._normalize_ipw:
-                    m_z_hat_prelim = _normalize_ipw(m_z_hat_prelim, z_train_1)
-
-                # propensity for d == 1 cond. on z == 0 (training set 1)
-                z0_train_1 = z_train_1 == 0
-                x_z0_train_1 = x_train_1[z0_train_1, :]
-                d_z0_train_1 = d_train_1[z0_train_1]
-                ml_m_d_z0_prelim = clone(fitted_models["ml_m_d_z0"][i_fold])
-                ml_m_d_z0_prelim.fit(x_z0_train_1, d_z0_train_1)
-                m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
-
-                # propensity for d == 1 cond. on z == 1 (training set 1)
-                z1_train_1 = z_train_1 == 1
-                x_z1_train_1 = x_train_1[z1_train_1, :]
-                d_z1_train_1 = d_train_1[z1_train_1]
-                ml_m_d_z1_prelim = clone(fitted_models["ml_m_d_z1"][i_fold])
-                ml_m_d_z1_prelim.fit(x_z1_train_1, d_z1_train_1)
-                m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
-
-                # preliminary estimate of theta_2_aux
-                comp_prob_prelim = np.mean(
-                    m_d_z1_hat_prelim
-                    - m_d_z0_hat_prelim
-                    + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
-                    - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim)
-                )
-
-                # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(
-                        self._compute_ipw_score(theta, d_train_1, y_train_1, m_z_hat_prelim, z_train_1, comp_prob_prelim)
-                    )
-                    return res
-
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
-                ipw_vec[i_fold] = ipw_est
+            parallel = Parallel(n_jobs=n_jobs_cv, verbose=0, pre_dispatch="2*n_jobs")
+            fold_models = [
+                {learner: fitted_models[learner][i_fold] for learner in self.params_names} for i_fold in range(self.n_folds)
+            ]
+            fold_res = parallel(
+                delayed(self._nuisance_est_fold)(x, y, d, z, strata, smpls[i_fold], fold_models[i_fold])
+                for i_fold in range(self.n_folds)
+            )
 
-                # use the preliminary estimates to fit the nuisance parameters on train_2
-                d_train_2 = d[train_inds_2]
-                y_train_2 = y[train_inds_2]
-                x_train_2 = x[train_inds_2, :]
-                z_train_2 = z[train_inds_2]
-
-                # define test observations
-                d_test = d[test_inds]
-                y_test = y[test_inds]
-                x_test = x[test_inds, :]
-                z_test = z[test_inds]
-
-                # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 0
-                z0_train_2 = z_train_2 == 0
-                x_z0_train_2 = x_train_2[z0_train_2, :]
-                du_z0_train_2 = (d_train_2[z0_train_2] == self._treatment) * (y_train_2[z0_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z0"][i_fold].fit(x_z0_train_2, du_z0_train_2)
-                g_du_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z0"][i_fold], x_test)
-
-                # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 1
-                z1_train_2 = z_train_2 == 1
-                x_z1_train_2 = x_train_2[z1_train_2, :]
-                du_z1_train_2 = (d_train_2[z1_train_2] == self._treatment) * (y_train_2[z1_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z1"][i_fold].fit(x_z1_train_2, du_z1_train_2)
-                g_du_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z1"][i_fold], x_test)
-
-                # the predictions of both should only be evaluated conditional on z == 0 or z == 1
-                test_inds_z0 = test_inds[z_test == 0]
-                test_inds_z1 = test_inds[z_test == 1]
-                g_du_z0_hat["targets"][test_inds_z0] = (
-                    1.0 * (d_test[z_test == 0] == self._treatment) * (y_test[z_test == 0] <= ipw_est)
-                )
-                g_du_z1_hat["targets"][test_inds_z1] = (
-                    1.0 * (d_test[z_test == 1] == self._treatment) * (y_test[z_test == 1] <= ipw_est)
-                )
-
-                # refit nuisance elements for the local potential quantile
-                z_train = z[train_inds]
-                x_train = x[train_inds]
-                d_train = d[train_inds]
-
-                # refit propensity for z (whole training set)
-                fitted_models["ml_m_z"][i_fold].fit(x_train, z_train)
-                m_z_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_z"][i_fold], x_test)
-
-                # refit propensity for d == 1 cond. on z == 0 (whole training set)
-                z0_train = z_train == 0
-                x_z0_train = x_train[z0_train, :]
-                d_z0_train = d_train[z0_train]
-                fitted_models["ml_m_d_z0"][i_fold].fit(x_z0_train, d_z0_train)
-                m_d_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z0"][i_fold], x_test)
-
-                # propensity for d == 1 cond. on z == 1 (whole training set)
-                x_z1_train = x_train[z_train == 1, :]
-                d_z1_train = d_train[z_train == 1]
-                fitted_models["ml_m_d_z1"][i_fold].fit(x_z1_train, d_z1_train)
-                m_d_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z1"][i_fold], x_test)
+            for i_fold, (test_inds, fold_preds, fold_targets, fold_fitted, ipw_est) in enumerate(fold_res):
+                ipw_vec[i_fold] = ipw_est
+                for learner, nuisance_hat in [
+                    ("ml_m_z", m_z_hat),
+                    ("ml_m_d_z0", m_d_z0_hat),
+                    ("ml_m_d_z1", m_d_z1_hat),
+                    ("ml_g_du_z0", g_du_z0_hat),
+                    ("ml_g_du_z1", g_du_z1_hat),
+                ]:
+                    nuisance_hat["preds"][test_inds] = fold_preds[learner]
+                    # the model is fitted in the worker, such that the returned copy has to be stored
+                    fitted_models[learner][i_fold] = fold_fitted[learner]
+                g_du_z0_hat["targets"][test_inds] = fold_targets["ml_g_du_z0"]
+                g_du_z1_hat["targets"][test_inds] = fold_targets["ml_g_du_z1"]
 
         # save targets and models
         m_z_hat["targets"] = z
@@ -506,8 +426,9 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             g_du_z0_hat["models"] = fitted_models["ml_g_du_z0"]
             g_du_z1_hat["models"] = fitted_models["ml_g_du_z1"]
 
-        # clip propensities
-        m_z_hat_adj = _trimm(m_z_hat["preds"], self.trimming_rule, self.trimming_threshold)
+        # clip propensities (the stored predictions are the clipped ones)
+        m_z_hat["preds"] = _trimm(m_z_hat["preds"], self.trimming_rule, self.trimming_threshold)
+        m_z_hat_adj = m_z_hat["preds"]
 
         if self._normalize_ipw:
             m_z_hat_adj = _normalize_ipw(m_z_hat_adj, z)
@@ -558,6 +479,99 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         }
         return psi_elements, preds
 
+    def _nuisance_est_fold(self, x, y, d, z, strata, smpls_fold, models):
+        train_inds, test_inds = smpls_fold
+
+        # start nested crossfitting
+        train_inds_1, train_inds_2 = train_test_split(train_inds, test_size=0.5, random_state=42, stratify=strata[train_inds])
+        smpls_prelim = [
+            (train, test)
+            for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=strata[train_inds_1])
+        ]
+
+        d_train_1 = d[train_inds_1]
+        y_train_1 = y[train_inds_1]
+        x_train_1 = x[train_inds_1, :]
+        z_train_1 = z[train_inds_1]
+
+        # preliminary propensity for z
+        ml_m_z_prelim = clone(models["ml_m_z"])
+        m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1, method="predict_proba", smpls=smpls_prelim)[
+            "preds"
+        ]
+
+        m_z_hat_prelim = _trimm(m_z_hat_prelim, self.trimming_rule, self.trimming_threshold)
+        if self._normalize_ipw:
+            m_z_hat_prelim = _normalize_ipw(m_z_hat_prelim, z_train_1)
+
+        # index arrays of the z == 0 and z == 1 subsamples, such that each covariate subset is copied only once
+        z0_train_1 = np.flatnonzero(z_train_1 == 0)
+        z1_train_1 = np.flatnonzero(z_train_1 == 1)
+
+        # propensity for d == 1 cond. on z == 0 (training set 1)
+        ml_m_d_z0_prelim = clone(models["ml_m_d_z0"])
+        ml_m_d_z0_prelim.fit(x_train_1[z0_train_1, :], d_train_1[z0_train_1])
+        m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
+
+        # propensity for d == 1 cond. on z == 1 (training set 1)
+        ml_m_d_z1_prelim = clone(models["ml_m_d_z1"])
+        ml_m_d_z1_prelim.fit(x_train_1[z1_train_1, :], d_train_1[z1_train_1])
+        m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
+
+        # preliminary estimate of theta_2_aux
+        comp_prob_prelim = np.mean(
+            m_d_z1_hat_prelim
+            - m_d_z0_hat_prelim
+            + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
+            - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim)
+        )
+
+        # preliminary ipw estimate
+        ipw_weights = self._compute_ipw_weights(d_train_1, m_z_hat_prelim, z_train_1, comp_prob_prelim)
+        ipw_est = _solve_weighted_ipw_score(y_train_1, ipw_weights, self.quantile, self._coef_start_val)
+
+        # use the preliminary estimates to fit the nuisance parameters on train_2
+        # (only the z == 0 and z == 1 subsamples of train_2 are needed)
+        train_inds_2_z0 = train_inds_2[z[train_inds_2] == 0]
+        train_inds_2_z1 = train_inds_2[z[train_inds_2] == 1]
+
+        # define test observations
+        x_test = x[test_inds, :]
+        preds = {}
+
+        # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 0
+        du_z0_train_2 = (d[train_inds_2_z0] == self._treatment) & (y[train_inds_2_z0] <= ipw_est)
+        models["ml_g_du_z0"].fit(x[train_inds_2_z0, :], du_z0_train_2)
+        preds["ml_g_du_z0"] = _predict_zero_one_propensity(models["ml_g_du_z0"], x_test)
+
+        # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 1
+        du_z1_train_2 = (d[train_inds_2_z1] == self._treatment) & (y[train_inds_2_z1] <= ipw_est)
+        models["ml_g_du_z1"].fit(x[train_inds_2_z1, :], du_z1_train_2)
+        preds["ml_g_du_z1"] = _predict_zero_one_propensity(models["ml_g_du_z1"], x_test)
+
+        # the targets are restricted to the z == 0 and z == 1 subsamples after all folds are collected
+        du_test = (d[test_inds] == self._treatment) & (y[test_inds] <= ipw_est)
+        targets = {"ml_g_du_z0": du_test, "ml_g_du_z1": du_test}
+
+        # refit nuisance elements for the local potential quantile
+        z_train = z[train_inds]
+        train_inds_z0 = train_inds[z_train == 0]
+        train_inds_z1 = train_inds[z_train == 1]
+
+        # refit propensity for z (whole training set)
+        models["ml_m_z"].fit(x[train_inds, :], z_train)
+        preds["ml_m_z"] = _predict_zero_one_propensity(models["ml_m_z"], x_test)
+
+        # refit propensity for d == 1 cond. on z == 0 (whole training set)
+        models["ml_m_d_z0"].fit(x[train_inds_z0, :], d[train_inds_z0])
+        preds["ml_m_d_z0"] = _predict_zero_one_propensity(models["ml_m_d_z0"], x_test)
+
+        # propensity for d == 1 cond. on z == 1 (whole training set)
+        models["ml_m_d_z1"].fit(x[train_inds_z1, :], d[train_inds_z1])
+        preds["ml_m_d_z1"] = _predict_zero_one_propensity(models["ml_m_d_z1"], x_test)
+
+        return test_inds, preds, targets, models, ipw_est
+
     def _nuisance_tuning(
         self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
     ):
@@ -573,7 +587,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         train_inds_z1 = [np.intersect1d(np.where(z == 1)[0], train) for train, _ in smpls]
         # use a very crude approximation of ipw_est
         approx_quant = np.quantile(y[d == self.treatment], self.quantile)
-        du = (d == self.treatment) * (y <= approx_quant)
+        du = (d == self.treatment) & (y <= approx_quant)
 
         m_z_tune_res = _dml_tune(
             z,
@@ -676,7 +690,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         )
         if one_instr:
             binary_instr = type_of_target(obj_dml_data.z) == "binary"
-            zero_one_instr = np.all((np.power(obj_dml_data.z, 2) - obj_dml_data.z) == 0)
+            zero_one_instr = np.all((obj_dml_data.z == 0) | (obj_dml_data.z == 1))
             if not (one_instr & binary_instr & zero_one_instr):
                 raise ValueError(err_msg)
         else:
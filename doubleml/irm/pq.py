@@ -11,11 +11,10 @@ from ..utils._estimation import (
     _dml_cv_predict,
     _trimm,
     _predict_zero_one_propensity,
-    _get_bracket_guess,
     _default_kde,
     _normalize_ipw,
     _dml_tune,
-    _solve_ipw_score,
+    _solve_weighted_ipw_score,
     _cond_targets,
 )
 from ..utils._checks import (
@@ -73,8 +72,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted gaussian kernel density estimate directly in ``0``, with
+        silverman's rule of thumb for bandwidth determination.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -217,9 +216,9 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
     def _score_element_names(self):
         return ["ind_d", "g", "m", "y"]
 
-    def _compute_ipw_score(self, theta, d, y, prop):
-        score = (d == self.treatment) / prop * (y <= theta) - self.quantile
-        return score
+    def _compute_ipw_weights(self, d, prop):
+        weights = (d == self.treatment) / prop
+        return weights
 
     def _compute_score(self, psi_elements, coef, inds=None):
         ind_d = psi_elements["ind_d"]
@@ -337,12 +336,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                     m_hat_prelim = 1 - m_hat_prelim
 
                 # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
-                    return res
-
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+                ipw_weights = self._compute_ipw_weights(d_train_1, m_hat_prelim)
+                ipw_est = _solve_weighted_ipw_score(y_train_1, ipw_weights, self.quantile, self._coef_start_val)
                 ipw_vec[i_fold] = ipw_est
 
                 # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -57,8 +57,8 @@ class DoubleMLQTE:
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted gaussian kernel density estimate directly in ``0``, with
+        silverman's rule of thumb for bandwidth determination.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -3,7 +3,7 @@ from sklearn.base import clone
 from sklearn.model_selection import train_test_split, StratifiedKFold
 
 from ...tests._utils import fit_predict_proba, tune_grid_search
-from ...utils._estimation import _dml_cv_predict, _normalize_ipw, _get_bracket_guess, _solve_ipw_score
+from ...utils._estimation import _dml_cv_predict, _normalize_ipw
 
 
 def fit_cvar(y, x, d, quantile,
@@ -38,9 +38,6 @@ def fit_nuisance_cvar(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
                       normalize_ipw, trimming_threshold, g_params, m_params):
     n_folds = len(smpls)
     n_obs = len(y)
-    coef_bounds = (y.min(), y.max())
-    y_treat = y[d == treatment]
-    coef_start_val = np.mean(y_treat[y_treat >= np.quantile(y_treat, quantile)])
 
     ml_g = clone(learner_g)
     ml_m = clone(learner_m)
@@ -92,12 +89,11 @@ def fit_nuisance_cvar(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
         if treatment == 0:
             m_hat_prelim = 1 - m_hat_prelim
 
-        def ipw_score(theta):
-            res = np.mean((d_train_1 == treatment) * (y_train_1 <= theta) / m_hat_prelim - quantile)
-            return res
-
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        # the preliminary estimate is the smallest outcome at which the ipw score is non-negative
+        ipw_weights = (d_train_1 == treatment) / m_hat_prelim
+        candidates = np.sort(y_train_1)
+        ipw_scores = np.array([np.mean(ipw_weights * (y_train_1 <= c)) - quantile for c in candidates])
+        ipw_est = candidates[np.argmax(ipw_scores >= 0)]
         ipw_vec[i_fold] = ipw_est
 
         # use the preliminary estimates to fit the nuisance parameters on train_2
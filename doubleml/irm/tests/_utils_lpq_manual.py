@@ -4,7 +4,7 @@ from sklearn.model_selection import train_test_split, StratifiedKFold
 from scipy.optimize import root_scalar
 
 from ...tests._utils import tune_grid_search
-from ...utils._estimation import _dml_cv_predict, _trimm, _default_kde, _normalize_ipw, _get_bracket_guess, _solve_ipw_score
+from ...utils._estimation import _dml_cv_predict, _trimm, _default_kde, _normalize_ipw
 
 
 def fit_lpq(y, x, d, z, quantile,
@@ -129,16 +129,19 @@ def fit_nuisance_lpq(y, x, d, z, quantile, learner_g, learner_m, smpls, treatmen
                                    + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
                                    - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim))
 
-        def ipw_score(theta):
-            sign = 2 * treatment - 1.0
-            weights = sign * (z_train_1 / m_z_hat_prelim - (1 - z_train_1) / (1 - m_z_hat_prelim)) / comp_prob_prelim
-            u = (d_train_1 == treatment) * (y_train_1 <= theta)
-            v = -1. * quantile
-            res = np.mean(weights * u + v)
-            return res
-
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        sign = 2 * treatment - 1.0
+        weights = sign * (z_train_1 / m_z_hat_prelim - (1 - z_train_1) / (1 - m_z_hat_prelim)) / comp_prob_prelim
+        ipw_weights = weights * (d_train_1 == treatment)
+        # evaluate the ipw score at every training outcome; below the smallest outcome the score equals -quantile
+        candidates = np.unique(y_train_1)
+        ipw_scores = np.array([np.mean(ipw_weights * (y_train_1 <= c)) - quantile for c in candidates])
+        sign_change = np.append(True, ipw_scores[:-1] < 0) != (ipw_scores < 0)
+        if np.any(sign_change):
+            # the sign change closest to the start value
+            roots = candidates[sign_change]
+            ipw_est = roots[np.argmin(np.abs(roots - coef_start_val))]
+        else:
+            ipw_est = candidates[np.argmin(np.abs(ipw_scores))]
         ipw_vec[i_fold] = ipw_est
 
         # use the preliminary estimates to fit the nuisance parameters on train_2
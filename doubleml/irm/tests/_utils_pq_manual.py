@@ -4,7 +4,7 @@ from sklearn.model_selection import train_test_split, StratifiedKFold
 from scipy.optimize import root_scalar
 
 from ...tests._utils import tune_grid_search
-from ...utils._estimation import _dml_cv_predict, _default_kde, _normalize_ipw, _solve_ipw_score, _get_bracket_guess
+from ...utils._estimation import _dml_cv_predict, _default_kde, _normalize_ipw
 
 
 def fit_pq(y, x, d, quantile,
@@ -39,10 +39,6 @@ def fit_nuisance_pq(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
                     trimming_threshold, normalize_ipw, g_params, m_params):
     n_folds = len(smpls)
     n_obs = len(y)
-    # initialize starting values and bounds
-    coef_bounds = (y.min(), y.max())
-    y_treat = y[d == treatment]
-    coef_start_val = np.quantile(y_treat, quantile)
 
     # initialize nuisance predictions
     g_hat = np.full(shape=n_obs, fill_value=np.nan)
@@ -83,12 +79,11 @@ def fit_nuisance_pq(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
         if treatment == 0:
             m_hat_prelim = 1 - m_hat_prelim
 
-        def ipw_score(theta):
-            res = np.mean((d_train_1 == treatment) * (y_train_1 <= theta) / m_hat_prelim - quantile)
-            return res
-
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        # the preliminary estimate is the smallest outcome at which the ipw score is non-negative
+        ipw_weights = (d_train_1 == treatment) / m_hat_prelim
+        candidates = np.sort(y_train_1)
+        ipw_scores = np.array([np.mean(ipw_weights * (y_train_1 <= c)) - quantile for c in candidates])
+        ipw_est = candidates[np.argmax(ipw_scores >= 0)]
 
         ipw_vec[i_fold] = ipw_est
 
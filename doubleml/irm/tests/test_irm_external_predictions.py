@@ -70,3 +70,27 @@ def doubleml_irm_fixture(irm_score, n_rep, set_ml_m_ext, set_ml_g_ext):
 @pytest.mark.ci
 def test_doubleml_irm_coef(doubleml_irm_fixture):
     assert math.isclose(doubleml_irm_fixture["coef_normal"], doubleml_irm_fixture["coef_ext"], rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_doubleml_irm_integer_external_propensities():
+    x, y, d = make_irm_data(n_obs=500, dim_x=20, theta=0.5, return_type="np.array", random_state=3141)
+    dml_data = DoubleMLData.from_arrays(x=x, y=y, d=d)
+
+    # integer-valued propensities are truncated at the trimming threshold as float predictions
+    m_hat_int = np.tile(d.astype(int).reshape(-1, 1), (1, 2))
+    m_hat_float = m_hat_int.astype(float)
+    coefs = []
+    for m_hat in [m_hat_int, m_hat_float]:
+        m_hat_before = m_hat.copy()
+        np.random.seed(3141)
+        dml_irm = DoubleMLIRM(ml_g=LinearRegression(), ml_m=DMLDummyClassifier(), obj_dml_data=dml_data,
+                              n_rep=2, trimming_threshold=0.05)
+        dml_irm.fit(external_predictions={"d": {"ml_m": m_hat}})
+        # the external predictions are not modified by the trimming
+        assert np.array_equal(m_hat, m_hat_before)
+        assert np.all(dml_irm.predictions["ml_m"] >= 0.05) and np.all(dml_irm.predictions["ml_m"] <= 0.95)
+        coefs.append(dml_irm.coef[0])
+
+    assert np.isfinite(coefs[0])
+    assert math.isclose(coefs[0], coefs[1], rel_tol=1e-9, abs_tol=1e-4)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+import doubleml as dml
+
+from sklearn.linear_model import LogisticRegression
+
+from ...tests._utils import draw_smpls
+
+
+@pytest.fixture(scope='module',
+                params=[1, 3])
+def n_rep(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def normalize_ipw(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_lpq_parallel_fixture(generate_data_local_quantiles, n_rep, normalize_ipw):
+    n_folds = 3
+
+    (x, y, d, z) = generate_data_local_quantiles
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d, z)
+    np.random.seed(42)
+    strata = d + 2 * z
+    all_smpls = draw_smpls(len(y), n_folds, n_rep=n_rep, groups=strata)
+
+    dml_objs = []
+    for n_jobs_cv in [None, 2]:
+        dml_lpq_obj = dml.DoubleMLLPQ(obj_dml_data,
+                                      LogisticRegression(), LogisticRegression(),
+                                      quantile=0.5,
+                                      n_folds=n_folds,
+                                      n_rep=n_rep,
+                                      normalize_ipw=normalize_ipw,
+                                      draw_sample_splitting=False)
+        dml_lpq_obj.set_sample_splitting(all_smpls=all_smpls)
+        np.random.seed(42)
+        dml_lpq_obj.fit(n_jobs_cv=n_jobs_cv, store_predictions=True, store_models=True)
+        dml_objs.append(dml_lpq_obj)
+
+    res_dict = {'dml_serial': dml_objs[0],
+                'dml_parallel': dml_objs[1]}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_lpq_parallel_coef(dml_lpq_parallel_fixture):
+    assert np.allclose(dml_lpq_parallel_fixture['dml_serial'].coef,
+                       dml_lpq_parallel_fixture['dml_parallel'].coef,
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_lpq_parallel_se(dml_lpq_parallel_fixture):
+    assert np.allclose(dml_lpq_parallel_fixture['dml_serial'].se,
+                       dml_lpq_parallel_fixture['dml_parallel'].se,
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_lpq_parallel_predictions(dml_lpq_parallel_fixture):
+    predictions_serial = dml_lpq_parallel_fixture['dml_serial'].predictions
+    predictions_parallel = dml_lpq_parallel_fixture['dml_parallel'].predictions
+    assert predictions_serial.keys() == predictions_parallel.keys()
+    for learner in predictions_serial.keys():
+        assert np.allclose(predictions_serial[learner], predictions_parallel[learner],
+                           rtol=1e-9, atol=1e-4, equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_lpq_parallel_models(dml_lpq_parallel_fixture):
+    models_serial = dml_lpq_parallel_fixture['dml_serial'].models
+    models_parallel = dml_lpq_parallel_fixture['dml_parallel'].models
+    assert models_serial.keys() == models_parallel.keys()
+    for learner in models_serial.keys():
+        for i_rep, fold_models_serial in enumerate(models_serial[learner]['d']):
+            fold_models_parallel = models_parallel[learner]['d'][i_rep]
+            assert len(fold_models_serial) == len(fold_models_parallel)
+            for model_serial, model_parallel in zip(fold_models_serial, fold_models_parallel):
+                assert np.allclose(model_serial.coef_, model_parallel.coef_, rtol=1e-9, atol=1e-4)
+                assert np.allclose(model_serial.intercept_, model_parallel.intercept_, rtol=1e-9, atol=1e-4)
@@ -32,7 +32,7 @@ def set_ml_g_ext(request):
 def doubleml_pq_fixture(n_rep, normalize_ipw, set_ml_m_ext, set_ml_g_ext):
     ext_predictions = {"d": {}}
     np.random.seed(3141)
-    data = make_irm_data(theta=1, n_obs=500, dim_x=5, return_type="DataFrame")
+    data = make_irm_data(theta=1, n_obs=2000, dim_x=5, return_type="DataFrame")
 
     dml_data = DoubleMLData(data, "y", "d")
     all_smpls = draw_smpls(len(dml_data.y), 5, n_rep=n_rep, groups=None)
@@ -209,9 +209,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                          'models': None}
             else:
                 # get an initial estimate for theta using the partialling out score
-                psi_a = -np.multiply(d - m_hat['preds'], d - m_hat['preds'])
-                psi_b = np.multiply(d - m_hat['preds'], y - l_hat['preds'])
-                theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
+                v_hat = d - m_hat['preds']
+                theta_initial = np.nanmean(np.multiply(v_hat, y - l_hat['preds'])) / np.nanmean(np.square(v_hat))
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial*d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
                                         return_models=return_models)
@@ -237,14 +236,16 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         v_hat = d - m_hat
 
         if isinstance(self.score, str):
+            # the score elements are computed in place to avoid temporary arrays
             if self.score == 'IV-type':
-                psi_a = - np.multiply(v_hat, d)
-                psi_b = np.multiply(v_hat, y - g_hat)
+                psi_a = np.multiply(v_hat, d)
+                psi_b = np.subtract(y, g_hat)
             else:
                 assert self.score == 'partialling out'
-                u_hat = y - l_hat
-                psi_a = -np.multiply(v_hat, v_hat)
-                psi_b = np.multiply(v_hat, u_hat)
+                psi_a = np.square(v_hat)
+                psi_b = np.subtract(y, l_hat)
+            np.negative(psi_a, out=psi_a)
+            psi_b *= v_hat
         else:
             assert callable(self.score)
             psi_a, psi_b = self.score(y=y, d=d,
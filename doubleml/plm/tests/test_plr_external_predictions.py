@@ -33,9 +33,8 @@ def set_ml_g_ext(request):
 
 
 @pytest.fixture(scope="module")
-def doubleml_plr_fixture(plr_score, n_rep, set_ml_m_ext, set_ml_l_ext, set_ml_g_ext):
-    ext_predictions = {"d": {}}
-
+def dml_plr_ref_fixture(plr_score, n_rep):
+    # the reference fit does not depend on which predictions are set externally
     x, y, d = make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type="np.array")
 
     np.random.seed(3141)
@@ -52,6 +51,16 @@ def doubleml_plr_fixture(plr_score, n_rep, set_ml_m_ext, set_ml_l_ext, set_ml_g_
 
     dml_plr.fit(store_predictions=True)
 
+    return {"dml_plr": dml_plr, "dml_data": dml_data}
+
+
+@pytest.fixture(scope="module")
+def doubleml_plr_fixture(dml_plr_ref_fixture, plr_score, n_rep, set_ml_m_ext, set_ml_l_ext, set_ml_g_ext):
+    ext_predictions = {"d": {}}
+
+    dml_plr = dml_plr_ref_fixture["dml_plr"]
+    kwargs = {"obj_dml_data": dml_plr_ref_fixture["dml_data"], "score": plr_score, "n_rep": n_rep}
+
     if set_ml_m_ext:
         ext_predictions["d"]["ml_m"] = dml_plr.predictions["ml_m"][:, :, 0]
         ml_m = DMLDummyRegressor()
@@ -1,3 +1,5 @@
+import os
+import shutil
 import pytest
 import pandas as pd
 import numpy as np
@@ -6,7 +8,7 @@ from doubleml import DoubleMLData, DoubleMLClusterData
 from doubleml.datasets import fetch_401K, fetch_bonus, make_plr_CCDDHNR2018, make_plr_turrell2018, \
     make_irm_data, make_iivm_data, _make_pliv_data, make_pliv_CHS2015, make_pliv_multiway_cluster_CKMS2021, \
     make_did_SZ2020, make_confounded_irm_data, make_confounded_plr_data, make_heterogeneous_data, make_ssm_data, \
-    make_irm_data_discrete_treatments
+    make_irm_data_discrete_treatments, make_batch, _read_cached, _download_cached
 
 msg_inv_return_type = 'Invalid return_type.'
 
@@ -42,6 +44,64 @@ def test_fetch_bonus_poly():
     assert len(data_bonus_w_poly.x_cols) == ((n_x+1) * n_x / 2 + n_x)
 
 
+@pytest.mark.ci
+def test_read_cached(tmp_path):
+    file_path = tmp_path / 'raw_data.csv'
+    df = pd.DataFrame({'a': [1, 2], 'b': [3., 4.]})
+    df.to_csv(file_path, index=False)
+    url = file_path.as_uri()
+    data_home = tmp_path / 'cache'
+
+    res_1 = _read_cached(url, pd.read_csv, data_home=data_home)
+    cache_path = _download_cached(url, data_home=data_home)
+    assert os.listdir(data_home) == [os.path.basename(cache_path)]
+
+    # the second call reads the cached raw file without downloading
+    file_path.unlink()
+    res_2 = _read_cached(url, pd.read_csv, data_home=data_home)
+    pd.testing.assert_frame_equal(res_1, df)
+    pd.testing.assert_frame_equal(res_2, df)
+
+
+@pytest.mark.ci
+def test_read_cached_unreadable_cache(tmp_path):
+    file_path = tmp_path / 'raw_data.csv'
+    df = pd.DataFrame({'a': [1, 2], 'b': [3., 4.]})
+    df.to_csv(file_path, index=False)
+    url = file_path.as_uri()
+    data_home = tmp_path / 'cache'
+
+    def read_fun(path):
+        with open(path) as f:
+            if f.read().startswith('corrupted'):
+                raise ValueError('Unreadable file.')
+        return pd.read_csv(path)
+
+    cache_path = _download_cached(url, data_home=data_home)
+    with open(cache_path, 'w') as f:
+        f.write('corrupted')
+    res = _read_cached(url, read_fun, data_home=data_home)
+    pd.testing.assert_frame_equal(res, df)
+    assert os.listdir(data_home) == [os.path.basename(cache_path)]
+
+
+@pytest.mark.ci
+def test_download_cached_failed_download(tmp_path, monkeypatch):
+    file_path = tmp_path / 'raw_data.csv'
+    pd.DataFrame({'a': [1, 2], 'b': [3., 4.]}).to_csv(file_path, index=False)
+    data_home = tmp_path / 'cache'
+
+    def interrupted_copy(src, dst):
+        dst.write(src.read(5))
+        raise OSError('Connection reset.')
+
+    monkeypatch.setattr(shutil, 'copyfileobj', interrupted_copy)
+    with pytest.raises(OSError, match='Connection reset.'):
+        _ = _download_cached(file_path.as_uri(), data_home=data_home)
+    # no partial or temporary files are left behind
+    assert os.listdir(data_home) == []
+
+
 @pytest.mark.ci
 def test_make_plr_CCDDHNR2018_return_types():
     np.random.seed(3141)
@@ -320,3 +380,63 @@ def test_make_data_discrete_treatments(n_levels):
     msg = 'n_levels must be an integer.'
     with pytest.raises(ValueError, match=msg):
         _ = make_irm_data_discrete_treatments(n_obs=n, n_levels=1.1)
+
+
+@pytest.mark.ci
+def test_make_data_singular_covariance():
+    # perfectly correlated covariates have a positive semi-definite (but singular) covariance matrix
+    np.random.seed(3141)
+    x, _, _, _, _ = make_pliv_multiway_cluster_CKMS2021(N=10, M=10, s_X=1.0, s_epsilon_v=1.0, return_type='array')
+    assert np.all(np.isfinite(x))
+    x, _, _ = make_did_SZ2020(n_obs=100, c=1.0, return_type='array')
+    assert np.all(np.isfinite(x))
+    res = make_confounded_plr_data(n_obs=100, c=1.0)
+    assert np.allclose(res['x'], res['x'][:, [0]])
+    res = make_irm_data_discrete_treatments(n_obs=100, c=1.0)
+    assert np.allclose(res['x'], res['x'][:, [0]])
+
+
+@pytest.mark.ci
+def test_make_data_random_state():
+    x_1, y_1, d_1 = make_plr_CCDDHNR2018(n_obs=100, return_type='array', random_state=3141)
+    x_2, y_2, d_2 = make_plr_CCDDHNR2018(n_obs=100, return_type='array', random_state=3141)
+    assert np.array_equal(x_1, x_2) & np.array_equal(y_1, y_2) & np.array_equal(d_1, d_2)
+    x_3, _, _ = make_plr_CCDDHNR2018(n_obs=100, return_type='array', random_state=np.random.default_rng(3141))
+    assert np.array_equal(x_1, x_3)
+
+    # without a random_state the global numpy random state is used
+    np.random.seed(3141)
+    x_1, _, _, _ = _make_pliv_data(n_obs=100, return_type='array')
+    np.random.seed(3141)
+    x_2, _, _, _ = _make_pliv_data(n_obs=100, return_type='array')
+    assert np.array_equal(x_1, x_2)
+
+    res_1 = make_heterogeneous_data(n_obs=100, random_state=42)
+    res_2 = make_heterogeneous_data(n_obs=100, random_state=42)
+    assert res_1['data'].equals(res_2['data'])
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('n_jobs', [None, 2])
+def test_make_batch(n_jobs):
+    res = make_batch(make_irm_data, 3, n_obs=100, dim_x=5, return_type='array', n_jobs=n_jobs, seed=3141)
+    assert len(res) == 3
+    assert all(x.shape == (100, 5) for x, _, _ in res)
+    assert not np.array_equal(res[0][0], res[1][0])
+    res_seq = make_batch(make_irm_data, 3, n_obs=100, dim_x=5, return_type='array', seed=3141)
+    assert all(np.array_equal(x, x_seq) for (x, _, _), (x_seq, _, _) in zip(res, res_seq))
+
+    msg = 'The number of replications n_reps must be of int type. 1.5 of type <class \'float\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        _ = make_batch(make_irm_data, 1.5)
+    msg = 'The number of replications n_reps must be positive. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        _ = make_batch(make_irm_data, 0)
+
+
+@pytest.mark.ci
+def test_make_pliv_multiway_cluster_CKMS2021_dtype():
+    x, y, d, _, z = make_pliv_multiway_cluster_CKMS2021(N=10, M=10, return_type='array', dtype=np.float32)
+    assert all(arr.dtype == np.float32 for arr in (x, y, d, z))
+    res = make_pliv_multiway_cluster_CKMS2021(N=10, M=10, return_type='DataFrame', dtype=np.float32)
+    assert res['X1'].dtype == np.float32
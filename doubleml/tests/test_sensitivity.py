@@ -112,7 +112,7 @@ def test_dml_sensitivity_benchmark(dml_sensitivity_multitreat_fixture):
 @pytest.fixture(scope="module")
 def test_dml_benchmark_fixture(benchmarking_set, n_rep):
     random_state = 42
-    x, y, d = make_irm_data(n_obs=50, dim_x=5, theta=0, return_type="np.array")
+    x, y, d = make_irm_data(n_obs=50, dim_x=5, theta=0, return_type="np.array", random_state=random_state)
 
     classifier_class = LogisticRegression
     regressor_class = LinearRegression
@@ -159,7 +159,7 @@ def _check_trimming(trimming_rule, trimming_threshold):
 def _check_zero_one_treatment(obj_dml):
     one_treat = (obj_dml._dml_data.n_treat == 1)
     binary_treat = (type_of_target(obj_dml._dml_data.d) == 'binary')
-    zero_one_treat = np.all((np.power(obj_dml._dml_data.d, 2) - obj_dml._dml_data.d) == 0)
+    zero_one_treat = np.all((obj_dml._dml_data.d == 0) | (obj_dml._dml_data.d == 1))
     if not (one_treat & binary_treat & zero_one_treat):
         raise ValueError('Incompatible data. '
                          f'To fit an {str(obj_dml.score)} model with DML '
@@ -208,7 +208,7 @@ def _check_is_propensity(preds, learner, learner_name, smpls, eps=1e-12):
 
 def _check_binary_predictions(pred, learner, learner_name, variable_name):
     binary_preds = (type_of_target(pred) == 'binary')
-    zero_one_preds = np.all((np.power(pred, 2) - pred) == 0)
+    zero_one_preds = np.all((pred == 0) | (pred == 1))
     if binary_preds & zero_one_preds:
         raise ValueError(f'For the binary variable {variable_name}, '
                          f'predictions obtained with the {learner_name} learner {str(learner)} are also '
@@ -262,7 +262,7 @@ def _check_weights(weights, score, n_obs, n_rep):
                 raise TypeError("weights must be a numpy array for ATTE score. "
                                 f"weights of type {str(type(weights))} was passed.")
 
-            is_binary = np.all((np.power(weights, 2) - weights) == 0)
+            is_binary = np.all((weights == 0) | (weights == 1))
             if not is_binary:
                 raise ValueError("weights must be binary for ATTE score.")
 
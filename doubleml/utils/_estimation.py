@@ -1,6 +1,5 @@
 import numpy as np
 import warnings
-from scipy.optimize import minimize_scalar
 
 from sklearn.model_selection import cross_val_predict
 from sklearn.base import clone
@@ -8,7 +7,7 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
 from sklearn.metrics import root_mean_squared_error, log_loss
 
-from statsmodels.nonparametric.kde import KDEUnivariate
+from statsmodels.nonparametric.bandwidths import select_bandwidth
 
 from joblib import Parallel, delayed
 
@@ -150,8 +149,9 @@ def _dml_tune(y, x, train_inds,
               learner, param_grid, scoring_method,
               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
     tune_res = list()
+    # the splitter holds no random state (each split draws from the global state), such that it can be shared by all folds
+    tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
     for train_index in train_inds:
-        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
         if search_mode == 'grid_search':
             g_grid_search = GridSearchCV(learner, param_grid,
                                          scoring=scoring_method,
@@ -184,8 +184,9 @@ def _draw_weights(method, n_rep_boot, n_obs):
 
 def _trimm(preds, trimming_rule, trimming_threshold):
     if trimming_rule == 'truncate':
-        preds[preds < trimming_threshold] = trimming_threshold
-        preds[preds > 1 - trimming_threshold] = 1 - trimming_threshold
+        # single pass without boolean masks; np.clip returns a new float array, such that integer-valued predictions are
+        # cast and external predictions provided by the user are not modified
+        preds = np.clip(preds, trimming_threshold, 1 - trimming_threshold)
     return preds
 
 
@@ -237,20 +238,35 @@ def _get_bracket_guess(score, coef_start, coef_bounds):
 
 
 def _default_kde(u, weights):
-    dens = KDEUnivariate(u)
-    dens.fit(kernel='gau', bw='silverman', weights=weights, fft=False)
-
-    return dens.evaluate(0)
-
-
-def _solve_ipw_score(ipw_score, bracket_guess):
-    def abs_ipw_score(theta):
-        return abs(ipw_score(theta))
-
-    res = minimize_scalar(abs_ipw_score,
-                          bracket=bracket_guess,
-                          method='brent')
-    ipw_est = res.x
+    # weighted gaussian kernel density at zero with silverman's rule of thumb, i.e., equivalent to
+    # KDEUnivariate(u).fit(kernel='gau', bw='silverman', weights=weights, fft=False).evaluate(0) but without evaluating
+    # the density on the whole support grid in fit (which is quadratic in the number of observations)
+    u = np.ravel(u)
+    bw = select_bandwidth(u, 'silverman', None)
+    kernel_values = np.exp(-0.5 * np.square(u / bw)) / np.sqrt(2 * np.pi)
+    dens = np.dot(weights, kernel_values) / (np.sum(weights) * bw)
+
+    return np.array([dens])
+
+
+def _solve_weighted_ipw_score(y, weights, quantile, coef_start):
+    # solves mean(weights * 1{y <= theta}) - quantile = 0; the score is a step function which only changes at the observed
+    # outcomes, such that it suffices to evaluate it at the sorted outcomes
+    order = np.argsort(y, kind='mergesort')
+    y_sorted = y[order]
+    score = np.cumsum(weights[order]) / len(y) - quantile
+    # for tied outcomes only the last position of the block corresponds to a valid evaluation of the score
+    valid = np.append(y_sorted[1:] != y_sorted[:-1], True)
+    y_sorted = y_sorted[valid]
+    score = score[valid]
+    # below the smallest outcome the score equals -quantile; as the weights may be negative, the score can change its sign
+    # multiple times, such that (as for a local root search) the sign change closest to the start value is selected
+    sign_change = np.diff(score < 0, prepend=True)
+    if np.any(sign_change):
+        roots = y_sorted[sign_change]
+        ipw_est = roots[np.argmin(np.abs(roots - coef_start))]
+    else:
+        ipw_est = y_sorted[np.argmin(np.abs(score))]
     return ipw_est
 
 
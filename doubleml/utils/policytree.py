@@ -108,8 +108,11 @@ class DoubleMLPolicyTree:
         -------
         self : object
         """
-        bin_signal = (np.sign(self._orth_signal) + 1) / 2
-        abs_signal = np.abs(self._orth_signal)
+        # map the sign of the signal to {0, 0.5, 1} in place to avoid temporary arrays
+        bin_signal = np.sign(self._orth_signal, dtype=float)
+        bin_signal += 1
+        bin_signal /= 2
+        abs_signal = np.abs(self._orth_signal, dtype=float)
 
         # fit the tree with target binary score, sample weights absolute score and
         # provided feature variables
@@ -157,6 +160,7 @@ class DoubleMLPolicyTree:
             raise KeyError(f'The features must have the keys {self._features.keys()}. '
                            f'Features with keys {features.keys()} were passed.')
 
-        predictions = self.policy_tree.predict(features)
+        # align the columns with the fitted features; the keys are only checked up to their order
+        predictions = self.policy_tree.predict(features[self._features.columns])
 
         return features.assign(pred_treatment=predictions.astype(int))
@@ -0,0 +1,27 @@
+import pytest
+import numpy as np
+
+from statsmodels.nonparametric.kde import KDEUnivariate
+
+from doubleml.utils._estimation import _default_kde
+
+
+@pytest.fixture(scope='module',
+                params=[100, 1000])
+def n_obs(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_default_kde(n_obs):
+    np.random.seed(3141)
+    u = np.random.normal(size=(n_obs, 1))
+    weights = np.random.normal(loc=0.5, size=n_obs)
+
+    dens = KDEUnivariate(u)
+    dens.fit(kernel='gau', bw='silverman', weights=weights.copy(), fft=False)
+    expected = dens.evaluate(0)
+
+    res = _default_kde(u, weights)
+    assert res.shape == expected.shape
+    assert np.allclose(res, expected, rtol=1e-9, atol=1e-4)
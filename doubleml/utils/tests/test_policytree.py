@@ -65,6 +65,19 @@ def test_dml_policytree_return_types(dml_policytree_fixture):
     assert isinstance(dml_policytree_fixture['policytree_model'].policy_tree, DecisionTreeClassifier)
 
 
+@pytest.mark.ci
+def test_dml_policytree_predict_column_order():
+    n = 50
+    np.random.seed(42)
+    features = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)), columns=['a', 'b', 'c'])
+    signal = np.random.normal(0, 1, size=(n, ))
+
+    policy_tree = dml.DoubleMLPolicyTree(signal, features, depth=2).fit()
+    pred = policy_tree.predict(features)
+    pred_reordered = policy_tree.predict(features[['c', 'a', 'b']])
+    assert np.array_equal(pred['pred_treatment'], pred_reordered['pred_treatment'])
+
+
 @pytest.mark.ci
 def test_doubleml_exception_policytree():
     random_features = pd.DataFrame(np.random.normal(0, 1, size=(2, 3)), columns=['a', 'b', 'c'])
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+
+from doubleml.utils._estimation import _solve_weighted_ipw_score
+
+
+def _weighted_inverted_cdf_quantile(y, weights, quantile):
+    # smallest outcome at which the weighted empirical distribution function reaches the quantile
+    candidates = np.unique(y)
+    cdf = np.array([np.sum(weights[y <= c]) for c in candidates]) / np.sum(weights)
+    return candidates[np.argmax(cdf >= quantile)]
+
+
+@pytest.fixture(scope='module',
+                params=[0.1, 0.25, 0.5, 0.75, 0.9])
+def quantile(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[False, True])
+def ties(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_solve_weighted_ipw_score_unweighted(quantile, ties):
+    np.random.seed(3141)
+    y = np.random.normal(size=200)
+    if ties:
+        y = np.round(y, 1)
+    weights = np.ones_like(y)
+
+    res = _solve_weighted_ipw_score(y, weights, quantile, coef_start=np.median(y))
+    expected = np.quantile(y, quantile, method='inverted_cdf')
+    assert res == expected
+
+
+@pytest.mark.ci
+def test_solve_weighted_ipw_score_nonnegative_weights(quantile, ties):
+    np.random.seed(3141)
+    y = np.random.normal(size=200)
+    if ties:
+        y = np.round(y, 1)
+    weights = np.random.uniform(0, 2, size=200) * np.random.binomial(1, 0.7, size=200)
+    # the score is normalised by the number of observations, such that the weights have to average to one
+    weights = weights / np.mean(weights)
+
+    # with non-negative weights the score has a single crossing, such that the start value does not matter
+    for coef_start in [y.min(), np.median(y), y.max()]:
+        res = _solve_weighted_ipw_score(y, weights, quantile, coef_start)
+        expected = _weighted_inverted_cdf_quantile(y, weights, quantile)
+        assert res == expected
+
+
+@pytest.mark.ci
+def test_solve_weighted_ipw_score_mixed_sign_weights():
+    # the scores at the sorted outcomes 1, ..., 6 are 4/6, 2/6, 1/6, 5/6, 6/6, 6/6 minus 0.5, i.e. the score changes its sign
+    # at the outcomes 1 (starting from -0.5), 2 and 4
+    y = np.array([4., 2., 6., 1., 5., 3.])
+    weights = np.array([4., -2., 0., 4., 1., -1.])
+
+    assert _solve_weighted_ipw_score(y, weights, 0.5, coef_start=0.) == 1.
+    assert _solve_weighted_ipw_score(y, weights, 0.5, coef_start=1.4) == 1.
+    assert _solve_weighted_ipw_score(y, weights, 0.5, coef_start=2.1) == 2.
+    assert _solve_weighted_ipw_score(y, weights, 0.5, coef_start=3.2) == 4.
+    assert _solve_weighted_ipw_score(y, weights, 0.5, coef_start=10.) == 4.
+
+
+@pytest.mark.ci
+def test_solve_weighted_ipw_score_no_sign_change():
+    # the scores at the sorted outcomes are -0.4, -0.1, -0.3, i.e. the score stays negative
+    y = np.array([3., 1., 2.])
+    weights = np.array([-0.6, 0.3, 0.9])
+
+    res = _solve_weighted_ipw_score(y, weights, 0.5, coef_start=1.)
+    assert res == 2.